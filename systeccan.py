@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 
-from ctypes import Structure, WINFUNCTYPE, POINTER, WinDLL, byref, sizeof, c_ubyte
+from ctypes import Array, Structure, WINFUNCTYPE, POINTER, WinDLL, byref, pointer, sizeof, c_ubyte
 from ctypes.wintypes import WORD, DWORD, BOOL, LPVOID, PWCHAR, PDWORD
+from collections import deque, namedtuple
+from operator import attrgetter
+import itertools
 import logging
 import os
+import struct
 import sys
+import threading
+import time
+import weakref
 
 __author__ = "Daniel Igaz"
 __copyright__ = "Copyright 2018"
@@ -18,7 +25,8 @@ __all__ = ['Baudrate', 'BaudrateEx', 'MsgFrameFormat', 'CanStatus', 'UsbStatus',
            'ResetFlags', 'ProductCode', 'CyclicFlags', 'PendingFlags', 'CanMsg', 'Status', 'Mode', 'HardwareInfoEx',
            'HardwareInitInfo', 'ChannelInfo', 'MsgCountInfo', 'VersionType', 'USBCanException', 'USBCanError',
            'USBCanCmdError', 'USBCanWarning', 'USBCanServer', 'MAX_MODULES', 'MAX_INSTANCES',
-           'ANY_MODULE', 'AMR_ALL', 'ACR_ALL', 'MAX_CYCLIC_CAN_MSG']
+           'ANY_MODULE', 'AMR_ALL', 'ACR_ALL', 'MAX_CYCLIC_CAN_MSG', 'CAN_MSG_STRUCT',
+           'CanMsgView', 'Capabilities']
 
 BYTE = c_ubyte
 PBYTE = POINTER(BYTE)
@@ -41,7 +49,7 @@ ANY_MODULE = 255
 INVALID_HANDLE = 0xFF
 
 
-class Baudrate(WORD):
+class Baudrate:
     """
     Specifies pre-defined baud rate values for GW-001, GW-002 and all systec USB-CANmoduls.
 
@@ -80,7 +88,23 @@ class Baudrate(WORD):
     BAUD_AUTO = -1
 
 
-class BaudrateEx(DWORD):
+# Baud rates and their messages for :meth:`USBCanServer.get_baudrate_message`, built once at import.
+_BAUDRATE_MSGS = {
+    Baudrate.BAUD_AUTO: "auto baudrate",
+    Baudrate.BAUD_10kBit: "10 kBit/sec",
+    Baudrate.BAUD_20kBit: "20 kBit/sec",
+    Baudrate.BAUD_50kBit: "50 kBit/sec",
+    Baudrate.BAUD_100kBit: "100 kBit/sec",
+    Baudrate.BAUD_125kBit: "125 kBit/sec",
+    Baudrate.BAUD_250kBit: "250 kBit/sec",
+    Baudrate.BAUD_500kBit: "500 kBit/sec",
+    Baudrate.BAUD_800kBit: "800 kBit/sec",
+    Baudrate.BAUD_1MBit: "1 MBit/s",
+    Baudrate.BAUD_USE_BTREX: "BTR Ext is used",
+}
+
+
+class BaudrateEx:
     """
     Specifies pre-defined baud rate values for all systec USB-CANmoduls.
 
@@ -158,7 +182,32 @@ class BaudrateEx(DWORD):
     BAUDEX_AUTO = 0xFFFFFFFF
 
 
-class MsgFrameFormat(BYTE):
+# Baud rates and their messages for :meth:`USBCanServer.get_baudrate_ex_message`, built once at import.
+_BAUDRATE_EX_MSGS = {
+    BaudrateEx.BAUDEX_AUTO: "auto baudrate",
+    BaudrateEx.BAUDEX_10kBit: "10 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_10kBit: "10 kBit/sec",
+    BaudrateEx.BAUDEX_20kBit: "20 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_20kBit: "20 kBit/sec",
+    BaudrateEx.BAUDEX_50kBit: "50 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_50kBit: "50 kBit/sec",
+    BaudrateEx.BAUDEX_100kBit: "100 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_100kBit: "100 kBit/sec",
+    BaudrateEx.BAUDEX_125kBit: "125 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_125kBit: "125 kBit/sec",
+    BaudrateEx.BAUDEX_250kBit: "250 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_250kBit: "250 kBit/sec",
+    BaudrateEx.BAUDEX_500kBit: "500 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_500kBit: "500 kBit/sec",
+    BaudrateEx.BAUDEX_800kBit: "800 kBit/sec",
+    BaudrateEx.BAUDEX_SP2_800kBit: "800 kBit/sec",
+    BaudrateEx.BAUDEX_1MBit: "1 MBit/s",
+    BaudrateEx.BAUDEX_SP2_1MBit: "1 MBit/s",
+    BaudrateEx.BAUDEX_USE_BTR01: "BTR0/BTR1 is used",
+}
+
+
+class MsgFrameFormat:
     """
     Specifies values for the frame format of CAN messages for member :attr:`CanMsg.m_bFF` in structure
     :class:`CanMsg`. These values can be combined.
@@ -282,7 +331,7 @@ class ReturnCode(BYTE):
     WARN_BUSY = 0x92
 
 
-class CbEvent(BYTE):
+class CbEvent:
     """
     This enum defines events for the callback functions of the library.
 
@@ -311,7 +360,11 @@ class CbEvent(BYTE):
     EVENT_RESERVED1 = 0x80
 
 
-class CanStatus(WORD):
+# the receive event as a plain module global, it is tested by every callback
+_EVENT_RECEIVE = CbEvent.EVENT_RECEIVE
+
+
+class CanStatus:
     """
     CAN error status bits. These bit values occurs in combination with the method :meth:`USBCanServer.get_status`.
 
@@ -349,7 +402,23 @@ class CanStatus(WORD):
     CANERR_TXMSGLOST = 0x400
 
 
-class UsbStatus(WORD):
+# Messages of the status bits for :meth:`USBCanServer.get_can_status_message`, built once at import.
+_CAN_STATUS_MSGS = {
+    CanStatus.CANERR_TXMSGLOST: "Transmit message lost",
+    CanStatus.CANERR_MEMTEST: "Memory test failed",
+    CanStatus.CANERR_REGTEST: "Register test failed",
+    CanStatus.CANERR_QXMTFULL: "Transmit queue is full",
+    CanStatus.CANERR_QOVERRUN: "Receive queue overrun",
+    CanStatus.CANERR_QRCVEMPTY: "Receive queue is empty",
+    CanStatus.CANERR_BUSOFF: "Bus Off",
+    CanStatus.CANERR_BUSHEAVY: "Error Passive",
+    CanStatus.CANERR_BUSLIGHT: "Warning Limit",
+    CanStatus.CANERR_OVERRUN: "Rx-buffer is full",
+    CanStatus.CANERR_XMTFULL: "Tx-buffer is full",
+}
+
+
+class UsbStatus:
     """
     USB error status bits. These bit values occurs in combination with the method :meth:`USBCanServer.get_status`.
 
@@ -383,7 +452,7 @@ AMR_ALL = 0xFFFFFFFF
 ACR_ALL = 0x0
 
 
-class OutputControl(BYTE):
+class OutputControl:
     """
     Specifies pre-defined values for the Output Control Register of SJA1000 on GW-001 and GW-002.
     These values are only important for GW-001 and GW-002.
@@ -401,7 +470,7 @@ class OutputControl(BYTE):
 DEFAULT_BUFFER_ENTRIES = 4096
 
 
-class Channel(BYTE):
+class Channel:
     """
     Specifies values for the CAN channel to be used on multi-channel USB-CANmoduls.
     """
@@ -422,7 +491,7 @@ class Channel(BYTE):
     CHANNEL_LIN = CHANNEL_CH1
 
 
-class ResetFlags(DWORD):
+class ResetFlags:
     """
     Specifies flags for resetting USB-CANmodul with method :meth:`USBCanServer.reset_can`.
     These flags can be used in combination.
@@ -508,7 +577,7 @@ PRODCODE_MASK_PID = 0xFFFF
 PRODCODE_MASK_PIDG3 = (PRODCODE_MASK_PID & 0xFFFFFFBF)
 
 
-class ProductCode(WORD):
+class ProductCode:
     """
     These values defines product codes for all known USB-CANmodul derivatives received in member
     :attr:`HardwareInfoEx.m_dwProductCode` of structure :class:`HardwareInfoEx`
@@ -551,7 +620,7 @@ class ProductCode(WORD):
 MAX_CYCLIC_CAN_MSG = 16
 
 
-class CyclicFlags(DWORD):
+class CyclicFlags:
     """
     Specifies flags for cyclical CAN messages.
     These flags can be used in combinations with method :meth:`USBCanServer.enable_cyclic_can_msg`.
@@ -600,8 +669,34 @@ class CyclicFlags(DWORD):
     #: CAN message with index 15 of the list will not be sent.
     CYCLIC_FLAG_LOCK_15 = 0x8000
 
+    @staticmethod
+    def lock(index):
+        """
+        Returns the flag which locks the CAN message with the given index of the list
+        (equivalent to :data:`CYCLIC_FLAG_LOCK_0` ... :data:`CYCLIC_FLAG_LOCK_15`).
+
+        :param int index: Index of the cyclic CAN message (0 - 15).
+        :return: Lock flag.
+        :rtype: int
+        """
+        return 1 << index
+
+    @staticmethod
+    def locks(indices):
+        """
+        Returns the combined flags which lock the CAN messages with the given indices of the list.
+
+        :param list(int) indices: Indices of the cyclic CAN messages (0 - 15).
+        :return: Lock flags.
+        :rtype: int
+        """
+        flags = 0
+        for index in indices:
+            flags |= 1 << index
+        return flags
 
-class PendingFlags(BYTE):
+
+class PendingFlags:
     """
     Specifies flags for method :meth:`USBCanServer.get_msg_pending`.
     These flags can be uses in combinations.
@@ -655,30 +750,124 @@ class CanMsg(Structure):
     ]
 
     def __init__(self, id=0, frame_format=MsgFrameFormat.MSG_FF_STD, data=[]):
-        super(CanMsg, self).__init__(id, frame_format, len(data), (BYTE * 8)(*data), 0)
+        super(CanMsg, self).__init__(id, frame_format)
+        if data:
+            self.data = data
 
     @property
-    def id(self): return self.m_dwID
+    def data(self): return self.m_bData[:self.m_bDLC]
 
-    @id.setter
-    def id(self, id): self.m_dwID = id
+    @data.setter
+    def data(self, data):
+        dlc = len(data)
+        self.m_bData[:dlc] = data
+        self.m_bDLC = dlc
 
-    @property
-    def frame_format(self): return self.m_bFF
+    time = property(attrgetter("m_dwTime"))
+
+    @classmethod
+    def pack_many(cls, ids, data, frame_format=MsgFrameFormat.MSG_FF_STD):
+        """
+        Builds an array of CAN messages which can be passed as a whole to :meth:`USBCanServer.write_can_msg`.
+
+        :param list(int) ids: CAN-IDs of the messages.
+        :param list(bytes) data: Data of each message (up to 8 bytes), in the same order as ``ids``.
+        :param int frame_format: Frame format of all messages (see enum :class:`MsgFrameFormat`).
+        :return: Array of CAN message structures.
+        :rtype: ctypes array of CanMsg
+        :raises ValueError: If ``ids`` and ``data`` differ in length or a payload is longer than 8 bytes.
+        """
+        if len(ids) != len(data):
+            raise ValueError("got %d CAN-IDs but %d payloads" % (len(ids), len(data)))
+        c_can_msg = (cls * len(ids))()
+        pack_into, size = CAN_MSG_STRUCT.pack_into, CAN_MSG_STRUCT.size
+        for offset, id, payload in zip(range(0, len(c_can_msg) * size, size), ids, data):
+            dlc = len(payload)
+            if dlc > 8:
+                raise ValueError("CAN message data is limited to 8 bytes, got %d" % dlc)
+            pack_into(c_can_msg, offset, id, frame_format, dlc, bytes(payload), 0)
+        return c_can_msg
+
+
+# The plain fields are exposed by aliasing the C field descriptors, so accessing them does not go through a
+# Python-level property function.
+CanMsg.id = CanMsg.m_dwID
+CanMsg.frame_format = CanMsg.m_bFF
+
+# Sizes of the structures are constant, they are computed once instead of by every call.
+_SIZEOF_CAN_MSG = sizeof(CanMsg)
 
-    @frame_format.setter
-    def frame_format(self, frame_format): self.m_bFF = frame_format
+
+class _CanMsgArrayTypes(dict):
+    # array types of CanMsg by length, a lookup is cheaper than evaluating CanMsg * count for every message batch
+    def __missing__(self, count):
+        array_type = self[count] = CanMsg * count
+        return array_type
+
+
+# prefilled up to the size of a list of cyclic CAN messages, other lengths are added on first use
+_CAN_MSG_ARRAYS = _CanMsgArrayTypes((count, CanMsg * count) for count in range(MAX_CYCLIC_CAN_MSG + 1))
+
+#: Binary layout of one :class:`CanMsg` record (CAN-ID, frame format, DLC, 8 data bytes, time stamp).
+#:
+#: Use it to scan the buffer returned by :meth:`USBCanServer.read_can_msg_buffer` without creating a :class:`CanMsg`
+#: per message, e.g. ``[data[:dlc] for id, ff, dlc, data, time in CAN_MSG_STRUCT.iter_unpack(buffer) if id == 0x12]``.
+CAN_MSG_STRUCT = struct.Struct("<IBB8sI")
+
+_DWORD_STRUCT = struct.Struct("<I")
+
+
+class CanMsgView:
+    """
+    Read-only view of one CAN message record inside a packed buffer.
+
+    The fields are decoded on access, so wrapping a record is much cheaper than creating a :class:`CanMsg`.
+    The view is only valid as long as the underlying buffer is not modified.
+
+    .. seealso::
+
+       :meth:`USBCanServer.read_can_msg_buffer`
+
+       :const:`CAN_MSG_STRUCT`
+    """
+    __slots__ = ("_mv",)
+
+    def __init__(self, mv):
+        self._mv = mv
+
+    @classmethod
+    def split(cls, buffer):
+        """
+        Creates a view for each CAN message record of a packed buffer.
+
+        :param buffer: Buffer of CAN message records (see method :meth:`USBCanServer.read_can_msg_buffer`).
+        :return: List of views, one per CAN message.
+        :rtype: list(CanMsgView)
+        """
+        mv = memoryview(buffer).cast("B")
+        size = CAN_MSG_STRUCT.size
+        return [cls(mv[offset:offset + size]) for offset in range(0, len(mv), size)]
 
     @property
-    def data(self): return self.m_bData[:self.m_bDLC]
+    def id(self): return _DWORD_STRUCT.unpack_from(self._mv, 0)[0]
 
-    @data.setter
-    def data(self, data):
-        self.m_bDLC = len(data)
-        self.m_bData((BYTE * 8)(*data))
+    @property
+    def frame_format(self): return self._mv[4]
 
     @property
-    def time(self): return self.m_dwTime
+    def data(self): return list(self._mv[6:6 + self._mv[5]])
+
+    @property
+    def time(self): return _DWORD_STRUCT.unpack_from(self._mv, 14)[0]
+
+    def materialize(self):
+        """
+        Copies the CAN message record into a new :class:`CanMsg`.
+
+        :return: CAN message structure independent of the underlying buffer.
+        :rtype: CanMsg
+        """
+        return CanMsg.from_buffer_copy(self._mv)
 
 
 class Status(Structure):
@@ -698,11 +887,8 @@ class Status(Structure):
         ("m_wUsbStatus", WORD),  # USB error status (see enum :class:`UsbStatus`)
     ]
 
-    @property
-    def can_status(self): return self.m_wCanStatus
-
-    @property
-    def usb_status(self): return self.m_wUsbStatus
+    can_status = property(attrgetter("m_wCanStatus"))
+    usb_status = property(attrgetter("m_wUsbStatus"))
 
 
 class Mode(BYTE):
@@ -723,6 +909,10 @@ class Mode(BYTE):
     MODE_HIGH_RES_TIMER = 8
 
 
+# Binary layout of :class:`InitCanParam`, used to fill all fields with a single pack instead of one by one.
+_INIT_CAN_PARAM_STRUCT = struct.Struct("<IBBBBIIIHH")
+
+
 class InitCanParam(Structure):
     """
     Structure including initialisation parameters used internally in :meth:`USBCanServer.init_can`.
@@ -746,8 +936,9 @@ class InitCanParam(Structure):
     ]
 
     def __init__(self, mode, BTR, OCR, AMR, ACR, baudrate, rx_buffer_entries, tx_buffer_entries):
-        super(InitCanParam, self).__init__(sizeof(InitCanParam), mode, BTR >> 8, BTR, OCR, AMR, ACR,
-                                           baudrate, rx_buffer_entries, tx_buffer_entries)
+        super(InitCanParam, self).__init__()
+        _INIT_CAN_PARAM_STRUCT.pack_into(self, 0, _SIZEOF_INIT_CAN_PARAM, mode, (BTR >> 8) & 0xFF, BTR & 0xFF, OCR,
+                                         AMR, ACR, baudrate, rx_buffer_entries, tx_buffer_entries)
 
     @property
     def mode(self): return self.m_bMode
@@ -759,7 +950,7 @@ class InitCanParam(Structure):
     def BTR(self): return self.m_bBTR0 << 8 | self.m_bBTR1
 
     @BTR.setter
-    def BTR(self, BTR): self.m_bBTR0, self.m_bBTR1 = BTR >> 8, BTR
+    def BTR(self, BTR): self.m_bBTR0, self.m_bBTR1 = (BTR >> 8) & 0xFF, BTR & 0xFF
 
     @property
     def OCR(self): return self.m_bOCR
@@ -786,6 +977,9 @@ class InitCanParam(Structure):
     def tx_buffer_entries(self, tx_buffer_entries): self.m_wNrOfTxBufferEntries = tx_buffer_entries
 
 
+_SIZEOF_INIT_CAN_PARAM = sizeof(InitCanParam)
+
+
 class Handle(BYTE):
     pass
 
@@ -814,30 +1008,24 @@ class HardwareInfoEx(Structure):
     ]
 
     def __init__(self):
-        super(HardwareInfoEx, self).__init__(sizeof(HardwareInfoEx))
-
-    @property
-    def device_number(self): return self.m_bDeviceNr
-
-    @property
-    def serial(self): return self.m_dwSerialNr
-
-    @property
-    def fw_version(self): return self.m_dwFwVersionEx
+        super(HardwareInfoEx, self).__init__(_SIZEOF_HARDWARE_INFO_EX)
 
-    @property
-    def product_code(self): return self.m_dwProductCode
+    device_number = property(attrgetter("m_bDeviceNr"))
+    serial = property(attrgetter("m_dwSerialNr"))
+    fw_version = property(attrgetter("m_dwFwVersionEx"))
+    product_code = property(attrgetter("m_dwProductCode"))
+    unique_id = property(attrgetter("m_dwUniqueId0", "m_dwUniqueId1", "m_dwUniqueId2", "m_dwUniqueId3"))
+    flags = property(attrgetter("m_dwFlags"))
 
-    @property
-    def unique_id(self): return self.m_dwUniqueId0, self.m_dwUniqueId1, self.m_dwUniqueId2, self.m_dwUniqueId3
 
-    @property
-    def flags(self): return self.m_dwFlags
+_SIZEOF_HARDWARE_INFO_EX = sizeof(HardwareInfoEx)
 
 
 # void PUBLIC UcanCallbackFktEx (Handle UcanHandle_p, DWORD dwEvent_p,
 #                                BYTE bChannel_p, void* pArg_p);
-CallbackFktEx = WINFUNCTYPE(None, Handle, DWORD, BYTE, LPVOID)
+# The handle is declared as BYTE (the type underlying Handle), so the callback receives a plain int instead of a new
+# Handle object for every event. It stays a WINFUNCTYPE, the 32-bit library calls it with stdcall.
+CallbackFktEx = WINFUNCTYPE(None, BYTE, DWORD, BYTE, LPVOID)
 
 
 class HardwareInitInfo(Structure):
@@ -882,31 +1070,22 @@ class ChannelInfo(Structure):
     ]
 
     def __init__(self):
-        super(ChannelInfo, self).__init__(sizeof(ChannelInfo))
+        super(ChannelInfo, self).__init__(_SIZEOF_CHANNEL_INFO)
 
-    @property
-    def mode(self): return self.m_bMode
+    mode = property(attrgetter("m_bMode"))
 
     @property
     def BTR(self): return self.m_bBTR0 << 8 | self.m_bBTR1
 
-    @property
-    def OCR(self): return self.m_bOCR
+    OCR = property(attrgetter("m_bOCR"))
+    AMR = property(attrgetter("m_dwAMR"))
+    ACR = property(attrgetter("m_dwACR"))
+    baudrate = property(attrgetter("m_dwBaudrate"))
+    can_is_init = property(attrgetter("m_fCanIsInit"))
+    can_status = property(attrgetter("m_wCanStatus"))
 
-    @property
-    def AMR(self): return self.m_dwAMR
 
-    @property
-    def ACR(self): return self.m_dwACR
-
-    @property
-    def baudrate(self): return self.m_dwBaudrate
-
-    @property
-    def can_is_init(self): return self.m_fCanIsInit
-
-    @property
-    def can_status(self): return self.m_wCanStatus
+_SIZEOF_CHANNEL_INFO = sizeof(ChannelInfo)
 
 
 class MsgCountInfo(Structure):
@@ -923,11 +1102,8 @@ class MsgCountInfo(Structure):
         ("m_wRecvdMsgCount", WORD),  # number of received CAN messages
     ]
 
-    @property
-    def sent_msg_count(self): return self.m_wSentMsgCount
-
-    @property
-    def recv_msg_count(self): return self.m_wRecvdMsgCount
+    sent_msg_count = property(attrgetter("m_wSentMsgCount"))
+    recv_msg_count = property(attrgetter("m_wRecvdMsgCount"))
 
 
 class VersionType(BYTE):
@@ -971,11 +1147,15 @@ EnumCallback = WINFUNCTYPE(None, DWORD, BOOL, POINTER(HardwareInfoEx), POINTER(H
 
 class USBCanException(Exception):
     """ Base class for USB can errors. """
+    __slots__ = ("result", "func", "arguments")
+
+    #: Messages of the return codes, looked up by :meth:`__str__` (defined by the subclasses).
+    return_msgs = NotImplemented
+
     def __init__(self, result, func, arguments):
         self.result = result.value
         self.func = func
         self.arguments = arguments
-        self.return_msgs = NotImplemented
 
     def __str__(self):
         return "Function %s returned %d: %s" % \
@@ -984,74 +1164,82 @@ class USBCanException(Exception):
 
 class USBCanError(USBCanException):
     """ Exception class for errors from USB-CAN-library. """
-    def __init__(self, result, func, arguments):
-        super(USBCanError, self).__init__(result, func, arguments)
-        self.return_msgs = {
-            ReturnCode.ERR_RESOURCE: "could not created a resource (memory, handle, ...)",
-            ReturnCode.ERR_MAXMODULES: "the maximum number of opened modules is reached",
-            ReturnCode.ERR_HWINUSE: "the specified module is already in use",
-            ReturnCode.ERR_ILLVERSION: "the software versions of the module and library are incompatible",
-            ReturnCode.ERR_ILLHW: "the module with the specified device number is not connected "
-                                          "(or used by an other application)",
-            ReturnCode.ERR_ILLHANDLE: "wrong USB-CAN-Handle handed over to the function",
-            ReturnCode.ERR_ILLPARAM: "wrong parameter handed over to the function",
-            ReturnCode.ERR_BUSY: "instruction can not be processed at this time",
-            ReturnCode.ERR_TIMEOUT: "no answer from module",
-            ReturnCode.ERR_IOFAILED: "a request to the driver failed",
-            ReturnCode.ERR_DLL_TXFULL: "a CAN message did not fit into the transmit buffer",
-            ReturnCode.ERR_MAXINSTANCES: "maximum number of applications is reached",
-            ReturnCode.ERR_CANNOTINIT: "CAN interface is not yet initialized",
-            ReturnCode.ERR_DISCONECT: "USB-CANmodul was disconnected",
-            ReturnCode.ERR_NOHWCLASS: "the needed device class does not exist",
-            ReturnCode.ERR_ILLCHANNEL: "illegal CAN channel",
-            ReturnCode.ERR_RESERVED1: "reserved",
-            ReturnCode.ERR_ILLHWTYPE: "the API function can not be used with this hardware",
-        }
+    __slots__ = ()
+
+    return_msgs = {
+        ReturnCode.ERR_RESOURCE: "could not created a resource (memory, handle, ...)",
+        ReturnCode.ERR_MAXMODULES: "the maximum number of opened modules is reached",
+        ReturnCode.ERR_HWINUSE: "the specified module is already in use",
+        ReturnCode.ERR_ILLVERSION: "the software versions of the module and library are incompatible",
+        ReturnCode.ERR_ILLHW: "the module with the specified device number is not connected "
+                              "(or used by an other application)",
+        ReturnCode.ERR_ILLHANDLE: "wrong USB-CAN-Handle handed over to the function",
+        ReturnCode.ERR_ILLPARAM: "wrong parameter handed over to the function",
+        ReturnCode.ERR_BUSY: "instruction can not be processed at this time",
+        ReturnCode.ERR_TIMEOUT: "no answer from module",
+        ReturnCode.ERR_IOFAILED: "a request to the driver failed",
+        ReturnCode.ERR_DLL_TXFULL: "a CAN message did not fit into the transmit buffer",
+        ReturnCode.ERR_MAXINSTANCES: "maximum number of applications is reached",
+        ReturnCode.ERR_CANNOTINIT: "CAN interface is not yet initialized",
+        ReturnCode.ERR_DISCONECT: "USB-CANmodul was disconnected",
+        ReturnCode.ERR_NOHWCLASS: "the needed device class does not exist",
+        ReturnCode.ERR_ILLCHANNEL: "illegal CAN channel",
+        ReturnCode.ERR_RESERVED1: "reserved",
+        ReturnCode.ERR_ILLHWTYPE: "the API function can not be used with this hardware",
+    }
 
 
 class USBCanCmdError(USBCanException):
     """ Exception class for errors from firmware in USB-CANmodul."""
-    def __init__(self, result, func, arguments):
-        super(USBCanCmdError, self).__init__(result, func, arguments)
-        self.return_msgs = {
-            ReturnCode.ERRCMD_NOTEQU: "the received response does not match to the transmitted command",
-            ReturnCode.ERRCMD_REGTST: "no access to the CAN controller",
-            ReturnCode.ERRCMD_ILLCMD: "the module could not interpret the command",
-            ReturnCode.ERRCMD_EEPROM: "error while reading the EEPROM",
-            ReturnCode.ERRCMD_RESERVED1: "reserved",
-            ReturnCode.ERRCMD_RESERVED2: "reserved",
-            ReturnCode.ERRCMD_RESERVED3: "reserved",
-            ReturnCode.ERRCMD_ILLBDR: "illegal baud rate value specified in BTR0/BTR1 for systec "
-                                              "USB-CANmoduls",
-            ReturnCode.ERRCMD_NOTINIT: "CAN channel is not initialized",
-            ReturnCode.ERRCMD_ALREADYINIT: "CAN channel is already initialized",
-            ReturnCode.ERRCMD_ILLSUBCMD: "illegal sub-command specified",
-            ReturnCode.ERRCMD_ILLIDX: "illegal index specified (e.g. index for cyclic CAN messages)",
-            ReturnCode.ERRCMD_RUNNING: "cyclic CAN message(s) can not be defined because transmission of "
-                                               "cyclic CAN messages is already running",
-        }
+    __slots__ = ()
+
+    return_msgs = {
+        ReturnCode.ERRCMD_NOTEQU: "the received response does not match to the transmitted command",
+        ReturnCode.ERRCMD_REGTST: "no access to the CAN controller",
+        ReturnCode.ERRCMD_ILLCMD: "the module could not interpret the command",
+        ReturnCode.ERRCMD_EEPROM: "error while reading the EEPROM",
+        ReturnCode.ERRCMD_RESERVED1: "reserved",
+        ReturnCode.ERRCMD_RESERVED2: "reserved",
+        ReturnCode.ERRCMD_RESERVED3: "reserved",
+        ReturnCode.ERRCMD_ILLBDR: "illegal baud rate value specified in BTR0/BTR1 for systec "
+                                  "USB-CANmoduls",
+        ReturnCode.ERRCMD_NOTINIT: "CAN channel is not initialized",
+        ReturnCode.ERRCMD_ALREADYINIT: "CAN channel is already initialized",
+        ReturnCode.ERRCMD_ILLSUBCMD: "illegal sub-command specified",
+        ReturnCode.ERRCMD_ILLIDX: "illegal index specified (e.g. index for cyclic CAN messages)",
+        ReturnCode.ERRCMD_RUNNING: "cyclic CAN message(s) can not be defined because transmission of "
+                                   "cyclic CAN messages is already running",
+    }
 
 
 class USBCanWarning(USBCanException):
     """ Exception class for warnings, the function has been executed anyway. """
-    def __init__(self, result, func, arguments):
-        super(USBCanWarning, self).__init__(result, func, arguments)
-        self.return_msgs = {
-            ReturnCode.WARN_NODATA: "no CAN messages received",
-            ReturnCode.WARN_SYS_RXOVERRUN: "overrun in receive buffer of the kernel driver",
-            ReturnCode.WARN_DLL_RXOVERRUN: "overrun in receive buffer of the USB-CAN-library",
-            ReturnCode.WARN_RESERVED1: "reserved",
-            ReturnCode.WARN_RESERVED2: "reserved",
-            ReturnCode.WARN_FW_TXOVERRUN: "overrun in transmit buffer of the firmware (but this CAN message "
-                                                  "was successfully stored in buffer of the ibrary)",
-            ReturnCode.WARN_FW_RXOVERRUN: "overrun in receive buffer of the firmware (but this CAN message "
-                                                  "was successfully read)",
-            ReturnCode.WARN_FW_TXMSGLOST: "reserved",
-            ReturnCode.WARN_NULL_PTR: "pointer is NULL",
-            ReturnCode.WARN_TXLIMIT: "not all CAN messages could be stored to the transmit buffer in "
-                                             "USB-CAN-library",
-            ReturnCode.WARN_BUSY: "reserved"
-        }
+    __slots__ = ()
+
+    return_msgs = {
+        ReturnCode.WARN_NODATA: "no CAN messages received",
+        ReturnCode.WARN_SYS_RXOVERRUN: "overrun in receive buffer of the kernel driver",
+        ReturnCode.WARN_DLL_RXOVERRUN: "overrun in receive buffer of the USB-CAN-library",
+        ReturnCode.WARN_RESERVED1: "reserved",
+        ReturnCode.WARN_RESERVED2: "reserved",
+        ReturnCode.WARN_FW_TXOVERRUN: "overrun in transmit buffer of the firmware (but this CAN message "
+                                      "was successfully stored in buffer of the ibrary)",
+        ReturnCode.WARN_FW_RXOVERRUN: "overrun in receive buffer of the firmware (but this CAN message "
+                                      "was successfully read)",
+        ReturnCode.WARN_FW_TXMSGLOST: "reserved",
+        ReturnCode.WARN_NULL_PTR: "pointer is NULL",
+        ReturnCode.WARN_TXLIMIT: "not all CAN messages could be stored to the transmit buffer in "
+                                 "USB-CAN-library",
+        ReturnCode.WARN_BUSY: "reserved"
+    }
+
+
+# Return codes as plain module globals, the checks below run on every read and write.
+_RC_SUCCESSFUL = ReturnCode.SUCCESSFUL
+_RC_ERRCMD = ReturnCode.ERRCMD
+_RC_WARNING = ReturnCode.WARNING
+_RC_WARN_NODATA = ReturnCode.WARN_NODATA
+_RC_WARN_TXLIMIT = ReturnCode.WARN_TXLIMIT
 
 
 def check_valid_rx_can_msg(result):
@@ -1062,23 +1250,16 @@ def check_valid_rx_can_msg(result):
     :return: True if a valid CAN messages was received, otherwise False.
     :rtype: bool
     """
-    return (result.value == ReturnCode.SUCCESSFUL) or (result.value > ReturnCode.WARNING)
-
-
-def check_tx_ok(result):
-    """
-    Checks if function :meth:`USBCanServer.write_can_msg` successfully wrote CAN message(s).
+    return (result.value == _RC_SUCCESSFUL) or (result.value > _RC_WARNING)
 
-    While using :meth:`USBCanServer.write_can_msg_ex` the number of sent CAN messages can be less than
-    the number of CAN messages which should be sent.
 
-    :param ReturnCode result: Error code of the function.
-    :return: True if CAN message(s) was(were) written successfully, otherwise False.
-    :rtype: bool
-
-    .. :seealso: :const:`ReturnCode.WARN_TXLIMIT`
-    """
-    return (result.value == ReturnCode.SUCCESSFUL) or (result.value > ReturnCode.WARNING)
+#: Checks if function :meth:`USBCanServer.write_can_msg` successfully wrote CAN message(s).
+#:
+#: While using :meth:`USBCanServer.write_can_msg_ex` the number of sent CAN messages can be less than
+#: the number of CAN messages which should be sent (see :const:`ReturnCode.WARN_TXLIMIT`).
+#:
+#: The check is the same as for received CAN messages, so this is an alias of :func:`check_valid_rx_can_msg`.
+check_tx_ok = check_valid_rx_can_msg
 
 
 def check_tx_success(result):
@@ -1089,7 +1270,7 @@ def check_tx_success(result):
     :return: True if CAN message(s) was(were) written successfully, otherwise False.
     :rtype: bool
     """
-    return result.value == ReturnCode.SUCCESSFUL
+    return result.value == _RC_SUCCESSFUL
 
 
 def check_tx_not_all(result):
@@ -1100,7 +1281,7 @@ def check_tx_not_all(result):
     :return: True if not all CAN messages were written, otherwise False.
     :rtype: bool
     """
-    return result.value == ReturnCode.WARN_TXLIMIT
+    return result.value == _RC_WARN_TXLIMIT
 
 
 def check_warning(result):
@@ -1111,7 +1292,7 @@ def check_warning(result):
     :return: True if a function returned warning, otherwise False.
     :rtype: bool
     """
-    return result.value >= ReturnCode.WARNING
+    return result.value >= _RC_WARNING
 
 
 def check_error(result):
@@ -1122,7 +1303,7 @@ def check_error(result):
     :return: True if a function returned error, otherwise False.
     :rtype: bool
     """
-    return (result.value != ReturnCode.SUCCESSFUL) and (result.value < ReturnCode.WARNING)
+    return (result.value != _RC_SUCCESSFUL) and (result.value < _RC_WARNING)
 
 
 def check_error_cmd(result):
@@ -1133,12 +1314,16 @@ def check_error_cmd(result):
     :return: True if a function returned error from firmware, otherwise False.
     :rtype: bool
     """
-    return (result.value >= ReturnCode.ERRCMD) and (result.value < ReturnCode.WARNING)
+    return (result.value >= _RC_ERRCMD) and (result.value < _RC_WARNING)
 
 
 def check_result(result, func, arguments):
+    # No pending data is the normal outcome of polling and not worth a warning.
+    if result.value == _RC_WARN_NODATA:
+        return result
     if check_warning(result):
-        logger.warning(USBCanWarning(result, func, arguments))
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(USBCanWarning(result, func, arguments))
     elif check_error(result):
         if check_error_cmd(result):
             raise USBCanCmdError(result, func, arguments)
@@ -1149,191 +1334,201 @@ def check_result(result, func, arguments):
 # Give a friendly explanation for the assumption of Windows OS.
 assert os.name == "nt", "The Systec adapter driver only runs on Windows"
 
-# Select the proper .DLL for the platform.
-# see first note in https://docs.python.org/3.7/library/platform.html
-try:
-    if sys.maxsize > 2**32:
-        usbcan_dll = WinDLL("USBCAN64.dll")
-    else:
-        usbcan_dll = WinDLL("USBCAN32.dll")
-except OSError as e:
-    print(e, "\n")
-    sys.stderr.write("If you reach this error, try:\n"
-        "1) Install the proper 32/64-bit USB-to-CAN driver from https://www.systec-electronic.com/\n"
-        "2) Read https://stackoverflow.com/questions/57187566/python-ctypes-loading-dll-throws-oserror-winerror-193-1-is-not-a-valid-win\n")
-    sys.exit(-1)
-
-# BOOL PUBLIC UcanSetDebugMode (DWORD dwDbgLevel_p, _TCHAR* pszFilePathName_p, DWORD dwFlags_p);
-UcanSetDebugMode = usbcan_dll.UcanSetDebugMode
-UcanSetDebugMode.restype = BOOL
-UcanSetDebugMode.argtypes = [DWORD, PWCHAR, DWORD]
-
-# DWORD PUBLIC UcanGetVersionEx (VersionType VerType_p);
-UcanGetVersionEx = usbcan_dll.UcanGetVersionEx
-UcanGetVersionEx.restype = DWORD
-UcanGetVersionEx.argtypes = [VersionType]
-
-# DWORD PUBLIC UcanGetFwVersion (Handle UcanHandle_p);
-UcanGetFwVersion = usbcan_dll.UcanGetFwVersion
-UcanGetFwVersion.restype = DWORD
-UcanGetFwVersion.argtypes = [Handle]
-
-# BYTE PUBLIC UcanInitHwConnectControlEx (ConnectControlFktEx fpConnectControlFktEx_p, void* pCallbackArg_p);
-UcanInitHwConnectControlEx = usbcan_dll.UcanInitHwConnectControlEx
-UcanInitHwConnectControlEx.restype = ReturnCode
-UcanInitHwConnectControlEx.argtypes = [ConnectControlFktEx, LPVOID]
-UcanInitHwConnectControlEx.errcheck = check_result
-
-# BYTE PUBLIC UcanDeinitHwConnectControl (void)
-UcanDeinitHwConnectControl = usbcan_dll.UcanDeinitHwConnectControl
-UcanDeinitHwConnectControl.restype = ReturnCode
-UcanDeinitHwConnectControl.argtypes = []
-UcanDeinitHwConnectControl.errcheck = check_result
-
-# DWORD PUBLIC UcanEnumerateHardware (EnumCallback fpCallback_p, void* pCallbackArg_p,
-#    BOOL  fEnumUsedDevs_p,
-#    BYTE  bDeviceNrLow_p,     BYTE  bDeviceNrHigh_p,
-#    DWORD dwSerialNrLow_p,    DWORD dwSerialNrHigh_p,
-#    DWORD dwProductCodeLow_p, DWORD dwProductCodeHigh_p);
-UcanEnumerateHardware = usbcan_dll.UcanEnumerateHardware
-UcanEnumerateHardware.restype = DWORD
-UcanEnumerateHardware.argtypes = [EnumCallback, LPVOID, BOOL, BYTE, BYTE, DWORD, DWORD, DWORD, DWORD]
-
-# BYTE PUBLIC UcanInitHardwareEx (Handle* pUcanHandle_p, BYTE bDeviceNr_p,
-#   CallbackFktEx fpCallbackFktEx_p, void* pCallbackArg_p);
-UcanInitHardwareEx = usbcan_dll.UcanInitHardwareEx
-UcanInitHardwareEx.restype = ReturnCode
-UcanInitHardwareEx.argtypes = [POINTER(Handle), BYTE, CallbackFktEx, LPVOID]
-UcanInitHardwareEx.errcheck = check_result
-
-# BYTE PUBLIC UcanInitHardwareEx2 (Handle* pUcanHandle_p, DWORD dwSerialNr_p,
-#   CallbackFktEx fpCallbackFktEx_p, void* pCallbackArg_p);
-UcanInitHardwareEx2 = usbcan_dll.UcanInitHardwareEx2
-UcanInitHardwareEx2.restype = ReturnCode
-UcanInitHardwareEx2.argtypes = [POINTER(Handle), DWORD, CallbackFktEx, LPVOID]
-UcanInitHardwareEx2.errcheck = check_result
-
-# BYTE PUBLIC UcanGetModuleTime (Handle UcanHandle_p, DWORD* pdwTime_p);
-UcanGetModuleTime = usbcan_dll.UcanGetModuleTime
-UcanGetModuleTime.restype = ReturnCode
-UcanGetModuleTime.argtypes = [Handle, PDWORD]
-UcanGetModuleTime.errcheck = check_result
-
-# BYTE PUBLIC UcanGetHardwareInfoEx2 (Handle UcanHandle_p,
-#   HardwareInfoEx* pHwInfo_p,
-#   ChannelInfo* pCanInfoCh0_p, ChannelInfo* pCanInfoCh1_p);
-UcanGetHardwareInfoEx2 = usbcan_dll.UcanGetHardwareInfoEx2
-UcanGetHardwareInfoEx2.restype = ReturnCode
-UcanGetHardwareInfoEx2.argtypes = [Handle, POINTER(HardwareInfoEx), POINTER(ChannelInfo),
-                                   POINTER(ChannelInfo)]
-UcanGetHardwareInfoEx2.errcheck = check_result
-
-# BYTE PUBLIC UcanInitCanEx2 (Handle UcanHandle_p, BYTE bChannel_p, tUcaninit_canParam* pinit_canParam_p);
-UcanInitCanEx2 = usbcan_dll.UcanInitCanEx2
-UcanInitCanEx2.restype = ReturnCode
-UcanInitCanEx2.argtypes = [Handle, BYTE, POINTER(InitCanParam)]
-UcanInitCanEx2.errcheck = check_result
-
-# BYTE PUBLIC UcanSetBaudrateEx (Handle UcanHandle_p,
-#   BYTE bChannel_p, BYTE bBTR0_p, BYTE bBTR1_p, DWORD dwBaudrate_p);
-UcanSetBaudrateEx = usbcan_dll.UcanSetBaudrateEx
-UcanSetBaudrateEx.restype = ReturnCode
-UcanSetBaudrateEx.argtypes = [Handle, BYTE, BYTE, BYTE, DWORD]
-UcanSetBaudrateEx.errcheck = check_result
-
-# BYTE PUBLIC UcanSetAcceptanceEx (Handle UcanHandle_p, BYTE bChannel_p,
-#   DWORD dwAMR_p, DWORD dwACR_p);
-UcanSetAcceptanceEx = usbcan_dll.UcanSetAcceptanceEx
-UcanSetAcceptanceEx.restype = ReturnCode
-UcanSetAcceptanceEx.argtypes = [Handle, BYTE, DWORD, DWORD]
-UcanSetAcceptanceEx.errcheck = check_result
-
-# BYTE PUBLIC UcanResetCanEx (Handle UcanHandle_p, BYTE bChannel_p, DWORD dwResetFlags_p);
-UcanResetCanEx = usbcan_dll.UcanResetCanEx
-UcanResetCanEx.restype = ReturnCode
-UcanResetCanEx.argtypes = [Handle, BYTE, DWORD]
-UcanResetCanEx.errcheck = check_result
-
-# BYTE PUBLIC UcanReadCanMsgEx (Handle UcanHandle_p, BYTE* pbChannel_p,
-#   CanMsg* pCanMsg_p, DWORD* pdwCount_p);
-UcanReadCanMsgEx = usbcan_dll.UcanReadCanMsgEx
-UcanReadCanMsgEx.restype = ReturnCode
-UcanReadCanMsgEx.argtypes = [Handle, PBYTE, POINTER(CanMsg), PDWORD]
-UcanReadCanMsgEx.errcheck = check_result
-
-# BYTE PUBLIC UcanWriteCanMsgEx (Handle UcanHandle_p, BYTE bChannel_p,
-#   CanMsg* pCanMsg_p, DWORD* pdwCount_p);
-UcanWriteCanMsgEx = usbcan_dll.UcanWriteCanMsgEx
-UcanWriteCanMsgEx.restype = ReturnCode
-UcanWriteCanMsgEx.argtypes = [Handle, BYTE, POINTER(CanMsg), PDWORD]
-UcanWriteCanMsgEx.errcheck = check_result
-
-# BYTE PUBLIC UcanGetStatusEx (Handle UcanHandle_p, BYTE bChannel_p, Status* pStatus_p);
-UcanGetStatusEx = usbcan_dll.UcanGetStatusEx
-UcanGetStatusEx.restype = ReturnCode
-UcanGetStatusEx.argtypes = [Handle, BYTE, POINTER(Status)]
-UcanGetStatusEx.errcheck = check_result
-
-# BYTE PUBLIC UcanGetMsgCountInfoEx (Handle UcanHandle_p, BYTE bChannel_p,
-#   MsgCountInfo* pMsgCountInfo_p);
-UcanGetMsgCountInfoEx = usbcan_dll.UcanGetMsgCountInfoEx
-UcanGetMsgCountInfoEx.restype = ReturnCode
-UcanGetMsgCountInfoEx.argtypes = [Handle, BYTE, POINTER(MsgCountInfo)]
-UcanGetMsgCountInfoEx.errcheck = check_result
-
-# BYTE PUBLIC UcanGetMsgPending (Handle UcanHandle_p,
-#   BYTE bChannel_p, DWORD dwFlags_p, DWORD* pdwPendingCount_p);
-UcanGetMsgPending = usbcan_dll.UcanGetMsgPending
-UcanGetMsgPending.restype = ReturnCode
-UcanGetMsgPending.argtypes = [Handle, BYTE, DWORD, PDWORD]
-UcanGetMsgPending.errcheck = check_result
-
-# BYTE PUBLIC UcanGetCanErrorCounter (Handle UcanHandle_p,
-#   BYTE bChannel_p, DWORD* pdwTxErrorCounter_p, DWORD* pdwRxErrorCounter_p);
-UcanGetCanErrorCounter = usbcan_dll.UcanGetCanErrorCounter
-UcanGetCanErrorCounter.restype = ReturnCode
-UcanGetCanErrorCounter.argtypes = [Handle, BYTE, PDWORD, PDWORD]
-UcanGetCanErrorCounter.errcheck = check_result
-
-# BYTE PUBLIC UcanSetTxTimeout (Handle UcanHandle_p,
-#   BYTE bChannel_p, DWORD dwTxTimeout_p);
-UcanSetTxTimeout = usbcan_dll.UcanSetTxTimeout
-UcanSetTxTimeout.restype = ReturnCode
-UcanSetTxTimeout.argtypes = [Handle, BYTE, DWORD]
-UcanSetTxTimeout.errcheck = check_result
-
-# BYTE PUBLIC UcanDeinitCanEx (Handle UcanHandle_p, BYTE bChannel_p);
-UcanDeinitCanEx = usbcan_dll.UcanDeinitCanEx
-UcanDeinitCanEx.restype = ReturnCode
-UcanDeinitCanEx.argtypes = [Handle, BYTE]
-UcanDeinitCanEx.errcheck = check_result
-
-# BYTE PUBLIC UcanDeinitHardware (Handle UcanHandle_p);
-UcanDeinitHardware = usbcan_dll.UcanDeinitHardware
-UcanDeinitHardware.restype = ReturnCode
-UcanDeinitHardware.argtypes = [Handle]
-UcanDeinitHardware.errcheck = check_result
-
-# BYTE PUBLIC UcanDefineCyclicCanMsg (Handle UcanHandle_p,
-#   BYTE bChannel_p, CanMsg* pCanMsgList_p, DWORD dwCount_p);
-UcanDefineCyclicCanMsg = usbcan_dll.UcanDefineCyclicCanMsg
-UcanDefineCyclicCanMsg.restype = ReturnCode
-UcanDefineCyclicCanMsg.argtypes = [Handle, BYTE, POINTER(CanMsg), DWORD]
-UcanDefineCyclicCanMsg.errcheck = check_result
-
-# BYTE PUBLIC UcanReadCyclicCanMsg (Handle UcanHandle_p,
-#   BYTE bChannel_p, CanMsg* pCanMsgList_p, DWORD* pdwCount_p);
-UcanReadCyclicCanMsg = usbcan_dll.UcanReadCyclicCanMsg
-UcanReadCyclicCanMsg.restype = ReturnCode
-UcanReadCyclicCanMsg.argtypes = [Handle, BYTE, POINTER(CanMsg), PDWORD]
-UcanReadCyclicCanMsg.errcheck = check_result
-
-# BYTE PUBLIC UcanEnableCyclicCanMsg (Handle UcanHandle_p,
-#   BYTE bChannel_p, DWORD dwFlags_p);
-UcanEnableCyclicCanMsg = usbcan_dll.UcanEnableCyclicCanMsg
-UcanEnableCyclicCanMsg.restype = ReturnCode
-UcanEnableCyclicCanMsg.argtypes = [Handle, BYTE, DWORD]
-UcanEnableCyclicCanMsg.errcheck = check_result
+#: Handle of the loaded USB-CAN-library (None until the first :class:`USBCanServer` needs it).
+usbcan_dll = None
+
+
+#: Prototypes of the functions used from the USB-CAN-library as tuples of (name, restype, argtypes, errcheck).
+_PROTOTYPES = (
+    # BOOL PUBLIC UcanSetDebugMode (DWORD dwDbgLevel_p, _TCHAR* pszFilePathName_p, DWORD dwFlags_p);
+    ("UcanSetDebugMode", BOOL, [DWORD, PWCHAR, DWORD], None),
+
+    # DWORD PUBLIC UcanGetVersionEx (VersionType VerType_p);
+    ("UcanGetVersionEx", DWORD, [VersionType], None),
+
+    # DWORD PUBLIC UcanGetFwVersion (Handle UcanHandle_p);
+    ("UcanGetFwVersion", DWORD, [Handle], None),
+
+    # BYTE PUBLIC UcanInitHwConnectControlEx (ConnectControlFktEx fpConnectControlFktEx_p, void* pCallbackArg_p);
+    ("UcanInitHwConnectControlEx", ReturnCode, [ConnectControlFktEx, LPVOID], check_result),
+
+    # BYTE PUBLIC UcanDeinitHwConnectControl (void)
+    ("UcanDeinitHwConnectControl", ReturnCode, [], check_result),
+
+    # DWORD PUBLIC UcanEnumerateHardware (EnumCallback fpCallback_p, void* pCallbackArg_p,
+    #    BOOL  fEnumUsedDevs_p,
+    #    BYTE  bDeviceNrLow_p,     BYTE  bDeviceNrHigh_p,
+    #    DWORD dwSerialNrLow_p,    DWORD dwSerialNrHigh_p,
+    #    DWORD dwProductCodeLow_p, DWORD dwProductCodeHigh_p);
+    ("UcanEnumerateHardware", DWORD, [EnumCallback, LPVOID, BOOL, BYTE, BYTE, DWORD, DWORD, DWORD, DWORD], None),
+
+    # BYTE PUBLIC UcanInitHardwareEx (Handle* pUcanHandle_p, BYTE bDeviceNr_p,
+    #   CallbackFktEx fpCallbackFktEx_p, void* pCallbackArg_p);
+    ("UcanInitHardwareEx", ReturnCode, [POINTER(Handle), BYTE, CallbackFktEx, LPVOID], check_result),
+
+    # BYTE PUBLIC UcanInitHardwareEx2 (Handle* pUcanHandle_p, DWORD dwSerialNr_p,
+    #   CallbackFktEx fpCallbackFktEx_p, void* pCallbackArg_p);
+    ("UcanInitHardwareEx2", ReturnCode, [POINTER(Handle), DWORD, CallbackFktEx, LPVOID], check_result),
+
+    # BYTE PUBLIC UcanGetModuleTime (Handle UcanHandle_p, DWORD* pdwTime_p);
+    ("UcanGetModuleTime", ReturnCode, [Handle, PDWORD], check_result),
+
+    # BYTE PUBLIC UcanGetHardwareInfoEx2 (Handle UcanHandle_p,
+    #   HardwareInfoEx* pHwInfo_p,
+    #   ChannelInfo* pCanInfoCh0_p, ChannelInfo* pCanInfoCh1_p);
+    ("UcanGetHardwareInfoEx2", ReturnCode, [Handle, POINTER(HardwareInfoEx), POINTER(ChannelInfo),
+                                            POINTER(ChannelInfo)], check_result),
+
+    # BYTE PUBLIC UcanInitCanEx2 (Handle UcanHandle_p, BYTE bChannel_p, tUcaninit_canParam* pinit_canParam_p);
+    ("UcanInitCanEx2", ReturnCode, [Handle, BYTE, POINTER(InitCanParam)], check_result),
+
+    # BYTE PUBLIC UcanSetBaudrateEx (Handle UcanHandle_p,
+    #   BYTE bChannel_p, BYTE bBTR0_p, BYTE bBTR1_p, DWORD dwBaudrate_p);
+    ("UcanSetBaudrateEx", ReturnCode, [Handle, BYTE, BYTE, BYTE, DWORD], check_result),
+
+    # BYTE PUBLIC UcanSetAcceptanceEx (Handle UcanHandle_p, BYTE bChannel_p,
+    #   DWORD dwAMR_p, DWORD dwACR_p);
+    ("UcanSetAcceptanceEx", ReturnCode, [Handle, BYTE, DWORD, DWORD], check_result),
+
+    # BYTE PUBLIC UcanResetCanEx (Handle UcanHandle_p, BYTE bChannel_p, DWORD dwResetFlags_p);
+    ("UcanResetCanEx", ReturnCode, [Handle, BYTE, DWORD], check_result),
+
+    # BYTE PUBLIC UcanReadCanMsgEx (Handle UcanHandle_p, BYTE* pbChannel_p,
+    #   CanMsg* pCanMsg_p, DWORD* pdwCount_p);
+    # The result of the functions on the read/write path is checked by the caller, skipping errcheck on success.
+    ("UcanReadCanMsgEx", ReturnCode, [Handle, PBYTE, POINTER(CanMsg), PDWORD], None),
+
+    # BYTE PUBLIC UcanWriteCanMsgEx (Handle UcanHandle_p, BYTE bChannel_p,
+    #   CanMsg* pCanMsg_p, DWORD* pdwCount_p);
+    ("UcanWriteCanMsgEx", ReturnCode, [Handle, BYTE, POINTER(CanMsg), PDWORD], None),
+
+    # BYTE PUBLIC UcanGetStatusEx (Handle UcanHandle_p, BYTE bChannel_p, Status* pStatus_p);
+    ("UcanGetStatusEx", ReturnCode, [Handle, BYTE, POINTER(Status)], check_result),
+
+    # BYTE PUBLIC UcanGetMsgCountInfoEx (Handle UcanHandle_p, BYTE bChannel_p,
+    #   MsgCountInfo* pMsgCountInfo_p);
+    ("UcanGetMsgCountInfoEx", ReturnCode, [Handle, BYTE, POINTER(MsgCountInfo)], check_result),
+
+    # BYTE PUBLIC UcanGetMsgPending (Handle UcanHandle_p,
+    #   BYTE bChannel_p, DWORD dwFlags_p, DWORD* pdwPendingCount_p);
+    ("UcanGetMsgPending", ReturnCode, [Handle, BYTE, DWORD, PDWORD], check_result),
+
+    # BYTE PUBLIC UcanGetCanErrorCounter (Handle UcanHandle_p,
+    #   BYTE bChannel_p, DWORD* pdwTxErrorCounter_p, DWORD* pdwRxErrorCounter_p);
+    ("UcanGetCanErrorCounter", ReturnCode, [Handle, BYTE, PDWORD, PDWORD], check_result),
+
+    # BYTE PUBLIC UcanSetTxTimeout (Handle UcanHandle_p,
+    #   BYTE bChannel_p, DWORD dwTxTimeout_p);
+    ("UcanSetTxTimeout", ReturnCode, [Handle, BYTE, DWORD], check_result),
+
+    # BYTE PUBLIC UcanDeinitCanEx (Handle UcanHandle_p, BYTE bChannel_p);
+    ("UcanDeinitCanEx", ReturnCode, [Handle, BYTE], check_result),
+
+    # BYTE PUBLIC UcanDeinitHardware (Handle UcanHandle_p);
+    ("UcanDeinitHardware", ReturnCode, [Handle], check_result),
+
+    # BYTE PUBLIC UcanDefineCyclicCanMsg (Handle UcanHandle_p,
+    #   BYTE bChannel_p, CanMsg* pCanMsgList_p, DWORD dwCount_p);
+    ("UcanDefineCyclicCanMsg", ReturnCode, [Handle, BYTE, POINTER(CanMsg), DWORD], check_result),
+
+    # BYTE PUBLIC UcanReadCyclicCanMsg (Handle UcanHandle_p,
+    #   BYTE bChannel_p, CanMsg* pCanMsgList_p, DWORD* pdwCount_p);
+    ("UcanReadCyclicCanMsg", ReturnCode, [Handle, BYTE, POINTER(CanMsg), PDWORD], check_result),
+
+    # BYTE PUBLIC UcanEnableCyclicCanMsg (Handle UcanHandle_p,
+    #   BYTE bChannel_p, DWORD dwFlags_p);
+    ("UcanEnableCyclicCanMsg", ReturnCode, [Handle, BYTE, DWORD], check_result),
+)
+
+
+# Functions of the USB-CAN-library, replaced by the loaded functions in _load_dll().
+UcanSetDebugMode = UcanGetVersionEx = UcanGetFwVersion = UcanInitHwConnectControlEx = UcanDeinitHwConnectControl = \
+UcanEnumerateHardware = UcanInitHardwareEx = UcanInitHardwareEx2 = UcanGetModuleTime = UcanGetHardwareInfoEx2 = \
+UcanInitCanEx2 = UcanSetBaudrateEx = UcanSetAcceptanceEx = UcanResetCanEx = UcanReadCanMsgEx = UcanWriteCanMsgEx = \
+UcanGetStatusEx = UcanGetMsgCountInfoEx = UcanGetMsgPending = UcanGetCanErrorCounter = UcanSetTxTimeout = \
+UcanDeinitCanEx = UcanDeinitHardware = UcanDefineCyclicCanMsg = UcanReadCyclicCanMsg = UcanEnableCyclicCanMsg = None
+
+
+def _load_dll():
+    """
+    Loads the USB-CAN-library and declares the prototypes of its functions.
+
+    The library is loaded on first use instead of at import, so the constants of this module can be used without
+    loading the driver.
+
+    :raises OSError: If the USB-CAN-library can not be loaded.
+    """
+    global usbcan_dll
+    if usbcan_dll is not None:
+        return
+
+    # Select the proper .DLL for the platform.
+    # see first note in https://docs.python.org/3.7/library/platform.html
+    try:
+        if sys.maxsize > 2**32:
+            usbcan_dll = WinDLL("USBCAN64.dll")
+        else:
+            usbcan_dll = WinDLL("USBCAN32.dll")
+    except OSError as e:
+        raise OSError("%s\nIf you reach this error, try:\n"
+            "1) Install the proper 32/64-bit USB-to-CAN driver from https://www.systec-electronic.com/\n"
+            "2) Read https://stackoverflow.com/questions/57187566/python-ctypes-loading-dll-throws-oserror-winerror-193-1-is-not-a-valid-win\n"
+            % e) from e
+
+    for name, restype, argtypes, errcheck in _PROTOTYPES:
+        func = getattr(usbcan_dll, name)
+        func.restype = restype
+        func.argtypes = argtypes
+        if errcheck is not None:
+            func.errcheck = errcheck
+        # replaces the placeholder of the module global, e.g. UcanReadCanMsgEx
+        globals()[name] = func
+
+
+#: Capabilities of an USB-CANmodul as returned by :meth:`USBCanServer.get_capabilities`, one field per
+#: ``check_is_*`` and ``check_support_*`` method of :class:`USBCanServer`.
+Capabilities = namedtuple("Capabilities", [
+    "is_systec", "is_G4", "is_G3", "support_cyclic_msg", "support_two_channel", "support_term_resistor",
+    "support_user_port", "support_rb_user_port", "support_rb_can_port", "support_ucannet"])
+
+# Lowest firmware versions as (major, minor) which support cyclic CAN messages, the USB-CANnetwork driver and the
+# user I/O port.
+_FW_CYCLIC_MSG = (3, 6)
+_FW_UCANNET = (3, 8)
+_FW_USER_PORT = (2, 16)
+
+
+# Capability tests on the product code and firmware version of HardwareInfoEx, shared by the check_* methods of
+# USBCanServer and USBCanServer.get_capabilities.
+def _is_systec(product_code):
+    return (product_code & PRODCODE_MASK_PID) >= ProductCode.PRODCODE_PID_MULTIPORT
+
+
+def _has_user_port(product_code):
+    pid = product_code & PRODCODE_MASK_PID
+    return pid != ProductCode.PRODCODE_PID_BASIC and pid != ProductCode.PRODCODE_PID_RESERVED1
+
+
+def _fw_at_least(version, major_minor):
+    return (version & 0xFF, (version & 0xFF00) >> 8) >= major_minor
+
+
+# AMR and ACR of 29-bit (ext) and 11-bit (std) CAN-ID ranges, see USBCanServer.calculate_amr and calculate_acr.
+# Loops over many ranges of the same frame format can select the function once instead of testing per range.
+def _amr_ext(from_id, to_id, rtr_only, rtr_too):
+    return ((from_id ^ to_id) << 3) | (0x7 if rtr_too and not rtr_only else 0x3)
+
+
+def _amr_std(from_id, to_id, rtr_only, rtr_too):
+    return ((from_id ^ to_id) << 21) | (0x1FFFFF if rtr_too and not rtr_only else 0xFFFFF)
+
+
+def _acr_ext(from_id, to_id, rtr_only, rtr_too):
+    return ((from_id & to_id) << 3) | (0x04 if rtr_only else 0)
+
+
+def _acr_std(from_id, to_id, rtr_only, rtr_too):
+    return ((from_id & to_id) << 21) | (0x100000 if rtr_only else 0)
 
 
 class USBCanServer:
@@ -1345,16 +1540,59 @@ class USBCanServer:
     """
     _modules_found = []
     _connect_control_ref = None
+    # initialized instances by the callback argument handed to the USB-CAN-library, an instance which is dropped without
+    # being shut down is not kept alive by its registration
+    _instances = weakref.WeakValueDictionary()
+    # source of the callback arguments, unlike id() a key is never used again by another instance
+    _callback_keys = itertools.count(1)
 
     def __init__(self):
+        _load_dll()
         self._handle = Handle(INVALID_HANDLE)
         self._is_initialized = False
         self._hw_is_initialized = False
-        self._ch_is_initialized = {
-            Channel.CHANNEL_CH0: False,
-            Channel.CHANNEL_CH1: False
+        # callback argument of the initialized hardware
+        self._callback_key = None
+        # CAN channels which are initialized
+        self._initialized_channels = set()
+        # ctypes holders reused by every call instead of allocating new ones per call
+        self._rx_channel = BYTE()
+        self._rx_count = DWORD()
+        self._rx_single = CanMsg()
+        # pointers to the holders are passed instead of creating a byref() for every read
+        self._rx_channel_p = pointer(self._rx_channel)
+        self._rx_count_p = pointer(self._rx_count)
+        self._rx_single_p = pointer(self._rx_single)
+        self._status = Status()
+        self._msg_count_info = MsgCountInfo()
+        self._rx_buf = None
+        self._tx_buf = None
+        self._cyclic_buf = (CanMsg * MAX_CYCLIC_CAN_MSG)()
+        # set by the callback when CAN messages were received
+        self._rx_event = threading.Event()
+        # background reader (see start_rx_thread), the queue holds tuples of (list of CanMsg, channel)
+        self._rx_thread = None
+        self._rx_thread_channel = Channel.CHANNEL_ANY
+        self._rx_thread_stop = threading.Event()
+        self._rx_thread_error = None
+        self._rx_queue = deque()
+        self._rx_queue_lock = threading.Lock()
+        self._rx_queue_ready = threading.Event()
+        # the handler of the most frequent event is called directly by the callback, without the table lookup
+        self._on_receive = self.can_msg_received_event
+        # handlers of the other events by event number, looked up once per callback instead of testing each event
+        self._callback_handlers = {
+            CbEvent.EVENT_INITHW: lambda channel: self.init_hw_event(),
+            CbEvent.EVENT_init_can: self.init_can_event,
+            CbEvent.EVENT_STATUS: self.status_event,
+            CbEvent.EVENT_DEINIT_CAN: self.deinit_can_event,
+            CbEvent.EVENT_DEINITHW: lambda channel: self.deinit_hw_event(),
+        }
+        self._connect_control_handlers = {
+            CbEvent.EVENT_FATALDISCON: self.fatal_disconnect_event,
+            CbEvent.EVENT_CONNECT: lambda param: self.connect_event(),
+            CbEvent.EVENT_DISCONNECT: lambda param: self.disconnect_event(),
         }
-        self._callback_ref = CallbackFktEx(self._callback)
         if self._connect_control_ref is None:
             self._connect_control_ref = ConnectControlFktEx(self._connect_control)
             UcanInitHwConnectControlEx(self._connect_control_ref, None)
@@ -1377,7 +1615,7 @@ class USBCanServer:
         :return: True if initialized, otherwise False.
         :rtype: bool
         """
-        return self._ch_is_initialized[Channel.CHANNEL_CH0]
+        return Channel.CHANNEL_CH0 in self._initialized_channels
 
     @property
     def is_can1_initialized(self):
@@ -1387,15 +1625,22 @@ class USBCanServer:
         :return: True if initialized, otherwise False.
         :rtype: bool
         """
-        return self._ch_is_initialized[Channel.CHANNEL_CH1]
+        return Channel.CHANNEL_CH1 in self._initialized_channels
 
     @classmethod
     def _enum_callback(cls, index, is_used, hw_info_ex, init_info, arg):
         cls._modules_found.append((index, bool(is_used), hw_info_ex.contents, init_info.contents))
 
+    @classmethod
+    def _dispatch_callback(cls, handle, event, channel, arg):
+        server = cls._instances.get(arg)
+        if server is not None:
+            server._callback(handle, event, channel, arg)
+
     @classmethod
     def enumerate_hardware(cls, device_number_low=0, device_number_high=-1, serial_low=0, serial_high=-1,
                            product_code_low=0, product_code_high=-1, enum_used_devices=False):
+        _load_dll()
         cls._modules_found = []
         UcanEnumerateHardware(cls._enum_callback_ref, None, enum_used_devices,
                               device_number_low, device_number_high,
@@ -1411,11 +1656,18 @@ class USBCanServer:
         :param int device_number: Device number (0 - 254, or :const:`ANY_MODULE` for the first device).
         """
         if not self._hw_is_initialized:
-            # initialize hardware either by device number or serial
-            if serial is None:
-                UcanInitHardwareEx(byref(self._handle), device_number, self._callback_ref, None)
-            else:
-                UcanInitHardwareEx2(byref(self._handle), serial, self._callback_ref, None)
+            # events of all instances go through one callback, the argument identifies the instance
+            key = self._callback_key = next(self._callback_keys)
+            self._instances[key] = self
+            try:
+                # initialize hardware either by device number or serial
+                if serial is None:
+                    UcanInitHardwareEx(byref(self._handle), device_number, self._callback_ref, key)
+                else:
+                    UcanInitHardwareEx2(byref(self._handle), serial, self._callback_ref, key)
+            except USBCanException:
+                del self._instances[key]
+                raise
             self._hw_is_initialized = True
 
     def init_can(self, channel=Channel.CHANNEL_CH0, BTR=Baudrate.BAUD_1MBit, baudrate=BaudrateEx.BAUDEX_USE_BTR01,
@@ -1435,27 +1687,198 @@ class USBCanServer:
         :param int rx_buffer_entries: The number of maximum entries in the receive buffer.
         :param int tx_buffer_entries: The number of maximum entries in the transmit buffer.
         """
-        if not self._ch_is_initialized.get(channel, False):
+        if channel not in self._initialized_channels:
             init_param = InitCanParam(mode, BTR, OCR, AMR, ACR, baudrate, rx_buffer_entries, tx_buffer_entries)
             UcanInitCanEx2(self._handle, channel, init_param)
-            self._ch_is_initialized[channel] = True
+            self._initialized_channels.add(channel)
+            # receive buffer large enough to drain the whole receive buffer of the channel with one read
+            if self._rx_buf is None or len(self._rx_buf) < rx_buffer_entries:
+                self._rx_buf = (CanMsg * rx_buffer_entries)()
 
-    def read_can_msg(self, channel, count):
+    def read_can_msg(self, channel, count, timeout=None):
         """
         Reads one or more CAN-messages from the buffer of the specified CAN channel.
 
+        Up to ``count`` messages are fetched with a single call into the USB-CAN-library, so draining the receive
+        buffer with a large ``count`` is much cheaper than reading one message per call.
+
+        With a ``timeout`` the call waits for the receive event of the USB-CAN-library instead of returning an empty
+        list at once, so the application does not need to poll. It returns as soon as at least one message was read,
+        or with an empty list when the timeout has elapsed. Without it the receive buffer is read directly.
+
+        While the background reader is running (see :meth:`start_rx_thread`) the messages are taken from its queue
+        instead, and ``channel`` is ignored.
+
         :param int channel:
             CAN channel to read from (:data:`Channel.CHANNEL_CH0`, :data:`Channel.CHANNEL_CH1`,
             :data:`Channel.CHANNEL_ANY`).
         :param int count: The number of CAN messages to be received.
+        :param float or None timeout: Time in seconds to wait for CAN messages (None does not wait).
         :return: Tuple with list of CAN message/s received and the CAN channel where the read CAN messages came from.
         :rtype: tuple(list(CanMsg), int)
         """
-        c_channel = BYTE(channel)
-        c_can_msg = (CanMsg * count)()
-        c_count = DWORD(count)
-        UcanReadCanMsgEx(self._handle, byref(c_channel), c_can_msg, byref(c_count))
-        return c_can_msg[:c_count.value], c_channel.value
+        if self._rx_thread is not None:
+            return self._pop_rx_queue(count, timeout)
+        if timeout is not None:
+            rx_event = self._rx_event
+            deadline = time.monotonic() + timeout
+            # the event may still be set from messages which were already read, then wait again until the deadline
+            while True:
+                remaining = max(deadline - time.monotonic(), 0)
+                if not rx_event.wait(remaining):
+                    return [], channel
+                rx_event.clear()
+                c_can_msg, received, read_channel = self._read_can_msg(channel, count)
+                if received:
+                    if received == count:
+                        # the buffer may hold more messages than were requested
+                        rx_event.set()
+                    return _CAN_MSG_ARRAYS[received].from_buffer_copy(c_can_msg)[:], read_channel
+                if not remaining:
+                    return [], channel
+        if count == 1:
+            # reading one message at a time is common, it needs no array type and no receive buffer
+            c_channel, c_count, c_single = self._rx_channel, self._rx_count, self._rx_single
+            c_channel.value, c_count.value = channel, 1
+            result = UcanReadCanMsgEx(self._handle, self._rx_channel_p, self._rx_single_p, self._rx_count_p)
+            if result.value:
+                check_result(result, UcanReadCanMsgEx, (self._handle, c_channel, c_single, c_count))
+            return ([CanMsg.from_buffer_copy(c_single)] if c_count.value else []), c_channel.value
+        c_can_msg, count, channel = self._read_can_msg(channel, count)
+        # copy only the received messages out of the reused buffer
+        return _CAN_MSG_ARRAYS[count].from_buffer_copy(c_can_msg)[:], channel
+
+    def read_can_msg_buffer(self, channel, count):
+        """
+        Reads one or more CAN-messages from the buffer of the specified CAN channel into a packed buffer.
+
+        Unlike :meth:`read_can_msg` no :class:`CanMsg` object is created per message and nothing is copied: the
+        returned buffer is a view of the internal receive buffer. Each record of it has the layout described by
+        :const:`CAN_MSG_STRUCT`; use :meth:`CanMsgView.split` to access the records by field name.
+
+        .. note:: The returned buffer is overwritten by the next read, copy what has to be kept.
+
+        .. note::
+            This method can not be used while the background reader is running (see :meth:`start_rx_thread`),
+            because both would take the messages from the receive buffer. Use :meth:`read_can_msg` then.
+
+        :param int channel:
+            CAN channel to read from (:data:`Channel.CHANNEL_CH0`, :data:`Channel.CHANNEL_CH1`,
+            :data:`Channel.CHANNEL_ANY`).
+        :param int count: The number of CAN messages to be received.
+        :return:
+            Tuple with the buffer of the CAN messages received and the CAN channel where the read CAN messages came
+            from.
+        :rtype: tuple(memoryview, int)
+        :raises RuntimeError: While the background reader is running.
+        """
+        if self._rx_thread is not None:
+            raise RuntimeError("read_can_msg_buffer() can not be used while the background reader is running")
+        c_can_msg, count, channel = self._read_can_msg(channel, count)
+        return memoryview(c_can_msg).cast("B")[:count * _SIZEOF_CAN_MSG], channel
+
+    def _read_can_msg(self, channel, count):
+        # reads into the reused receive buffer, returns it with the number of messages received and their channel
+        c_channel, c_count = self._rx_channel, self._rx_count
+        c_channel.value, c_count.value = channel, count
+        c_can_msg = self._rx_buf
+        if c_can_msg is None or len(c_can_msg) < count:
+            c_can_msg = self._rx_buf = (CanMsg * count)()
+        result = UcanReadCanMsgEx(self._handle, self._rx_channel_p, c_can_msg, self._rx_count_p)
+        if result.value:
+            check_result(result, UcanReadCanMsgEx, (self._handle, c_channel, c_can_msg, c_count))
+        return c_can_msg, c_count.value, c_channel.value
+
+    def start_rx_thread(self, channel=Channel.CHANNEL_ANY, poll_interval=0.1):
+        """
+        Starts a background thread which continuously reads the CAN messages of the specified channel.
+
+        The thread drains the receive buffer of the USB-CAN-library into a queue while the application processes the
+        messages received before, :meth:`read_can_msg` then takes the messages from this queue. The thread sleeps
+        until the USB-CAN-library reports received messages. An error of the thread stops it and is raised by the
+        next :meth:`read_can_msg` after the queue was emptied. Starting the thread again before that discards the
+        error and the queued messages.
+
+        :param int channel:
+            CAN channel to read from (:data:`Channel.CHANNEL_CH0`, :data:`Channel.CHANNEL_CH1`,
+            :data:`Channel.CHANNEL_ANY`).
+        :param float poll_interval:
+            Maximum time in seconds the thread waits for the receive event before it reads anyway.
+        """
+        if self._rx_thread is not None and not self._rx_thread.is_alive():
+            # the thread has ended with an error which was not raised yet
+            self.stop_rx_thread()
+        if self._rx_thread is None:
+            self._rx_thread_channel = channel
+            self._rx_thread_stop.clear()
+            self._rx_thread_error = None
+            self._rx_thread = threading.Thread(target=self._rx_thread_run, args=(channel, poll_interval),
+                                               name="USBCanServer-rx", daemon=True)
+            self._rx_thread.start()
+
+    def stop_rx_thread(self):
+        """
+        Stops the background thread started by :meth:`start_rx_thread`.
+
+        CAN messages still in the queue are discarded.
+        """
+        if self._rx_thread is not None:
+            self._rx_thread_stop.set()
+            # wake up the thread waiting for received messages
+            self._rx_event.set()
+            self._rx_thread.join()
+            self._rx_thread = None
+            self._rx_queue.clear()
+
+    def _rx_thread_run(self, channel, poll_interval):
+        # the thread uses its own holders and buffer, the ones of _read_can_msg belong to the application thread
+        c_channel, c_count = BYTE(), DWORD()
+        c_channel_p, c_count_p = pointer(c_channel), pointer(c_count)
+        c_can_msg = (CanMsg * (len(self._rx_buf) if self._rx_buf is not None else DEFAULT_BUFFER_ENTRIES))()
+        size = len(c_can_msg)
+        stop, rx_event, queue, ready = self._rx_thread_stop, self._rx_event, self._rx_queue, self._rx_queue_ready
+        while not stop.is_set():
+            rx_event.clear()
+            c_channel.value, c_count.value = channel, size
+            result = UcanReadCanMsgEx(self._handle, c_channel_p, c_can_msg, c_count_p)
+            if result.value:
+                try:
+                    check_result(result, UcanReadCanMsgEx, (self._handle, c_channel, c_can_msg, c_count))
+                except USBCanException as e:
+                    self._rx_thread_error = e
+                    ready.set()
+                    break
+            count = c_count.value
+            if count:
+                # only the application thread takes from the left side, so appending needs no lock
+                queue.append((_CAN_MSG_ARRAYS[count].from_buffer_copy(c_can_msg)[:], c_channel.value))
+                ready.set()
+            if count < size:
+                rx_event.wait(poll_interval)
+
+    def _pop_rx_queue(self, count, timeout):
+        # takes up to count messages of one channel from the queue of the background reader
+        queue = self._rx_queue
+        if timeout is not None and not queue:
+            ready = self._rx_queue_ready
+            ready.clear()
+            # the thread may have appended or ended with an error before the event was cleared
+            if not queue and self._rx_thread_error is None:
+                ready.wait(timeout)
+        with self._rx_queue_lock:
+            if not queue:
+                if self._rx_thread_error is not None:
+                    # the thread has ended, following reads go to the USB-CAN-library again
+                    error, self._rx_thread_error, self._rx_thread = self._rx_thread_error, None, None
+                    raise error
+                return [], self._rx_thread_channel
+            can_msg, channel = queue.popleft()
+            while len(can_msg) < count and queue and queue[0][1] == channel:
+                can_msg += queue.popleft()[0]
+            if len(can_msg) > count:
+                queue.appendleft((can_msg[count:], channel))
+                del can_msg[count:]
+        return can_msg, channel
 
     def write_can_msg(self, channel, can_msg):
         """
@@ -1463,14 +1886,26 @@ class USBCanServer:
 
         :param int channel:
             CAN channel, which is to be used (:data:`Channel.CHANNEL_CH0` or :data:`Channel.CHANNEL_CH1`).
-        :param list(CanMsg) can_msg: List of CAN message structure (see structure :class:`CanMsg`).
+        :param list(CanMsg) can_msg:
+            List of CAN message structure (see structure :class:`CanMsg`), or an array of them as built by
+            :meth:`CanMsg.pack_many` which is passed on without copying.
         :return: The number of successfully transmitted CAN messages.
         :rtype: int
         """
-        c_can_msg = (CanMsg * len(can_msg))(*can_msg)
-        c_count = DWORD(len(can_msg))
-        UcanWriteCanMsgEx(self._handle, channel, c_can_msg, c_count)
-        return c_count
+        count = len(can_msg)
+        if isinstance(can_msg, Array):
+            c_can_msg = can_msg
+        else:
+            # copy the messages into the reused transmit buffer
+            c_can_msg = self._tx_buf
+            if c_can_msg is None or len(c_can_msg) < count:
+                c_can_msg = self._tx_buf = (CanMsg * count)()
+            c_can_msg[:count] = can_msg
+        c_count = DWORD(count)
+        result = UcanWriteCanMsgEx(self._handle, channel, c_can_msg, byref(c_count))
+        if result.value:
+            check_result(result, UcanWriteCanMsgEx, (self._handle, channel, c_can_msg, c_count))
+        return c_count.value
 
     def set_baudrate(self, channel, BTR, baudarate):
         """
@@ -1503,7 +1938,7 @@ class USBCanServer:
         :return: Tuple with CAN and USB status (see structure :class:`Status`).
         :rtype: tuple(int, int)
         """
-        status = Status()
+        status = self._status
         UcanGetStatusEx(self._handle, channel, byref(status))
         return status.can_status, status.usb_status
 
@@ -1516,7 +1951,7 @@ class USBCanServer:
         :return: Tuple with number of CAN messages sent and received.
         :rtype: tuple(int, int)
         """
-        msg_count_info = MsgCountInfo()
+        msg_count_info = self._msg_count_info
         UcanGetMsgCountInfoEx(self._handle, channel, byref(msg_count_info))
         return msg_count_info.sent_msg_count, msg_count_info.recv_msg_count
 
@@ -1559,15 +1994,22 @@ class USBCanServer:
 
         :param int channel: CAN channel, to be used (:data:`Channel.CHANNEL_CH0` or :data:`Channel.CHANNEL_CH1`).
         :param list(CanMsg) can_msg:
-            List of CAN messages (up to 16, see structure :class:`CanMsg`), or None to delete an older list.
-        """
-        if can_msg is not None:
-            c_can_msg = (CanMsg * len(can_msg))(*can_msg)
-            c_count = DWORD(len(can_msg))
+            List of CAN messages (up to 16, see structure :class:`CanMsg`), or an array of them as built by
+            :meth:`CanMsg.pack_many` which is passed on without copying, or None to delete an older list.
+        """
+        count = len(can_msg) if can_msg is not None else 0
+        if not count:
+            # NULL deletes the list, ctypes passes None as a NULL pointer
+            c_can_msg = None
+        elif isinstance(can_msg, Array):
+            c_can_msg = can_msg
         else:
-            c_can_msg = CanMsg()
-            c_count = 0
-        UcanDefineCyclicCanMsg(self._handle, channel, c_can_msg, c_count)
+            # copy the messages into the reused buffer, the library keeps its own copy of the list
+            c_can_msg = self._cyclic_buf
+            if len(c_can_msg) < count:
+                c_can_msg = self._cyclic_buf = (CanMsg * count)()
+            c_can_msg[:count] = can_msg
+        UcanDefineCyclicCanMsg(self._handle, channel, c_can_msg, count)
 
     def read_cyclic_can_msg(self, channel, count):
         """
@@ -1578,11 +2020,30 @@ class USBCanServer:
         :return: List of received CAN messages (up to 16, see structure :class:`CanMsg`).
         :rtype: list(CanMsg)
         """
-        c_channel = BYTE(channel)
-        c_can_msg = (CanMsg * count)()
-        c_count = DWORD(count)
-        UcanReadCyclicCanMsg(self._handle, byref(c_channel), c_can_msg, c_count)
-        return c_can_msg[:c_count.value]
+        c_can_msg = self._cyclic_buf
+        if len(c_can_msg) < count:
+            c_can_msg = self._cyclic_buf = (CanMsg * count)()
+        count = self.read_cyclic_can_msg_into(channel, c_can_msg, count)
+        # copy the messages out of the reused buffer
+        return _CAN_MSG_ARRAYS[count].from_buffer_copy(c_can_msg)[:]
+
+    def read_cyclic_can_msg_into(self, channel, buf, count=None):
+        """
+        Reads back the list of CAN messages for automatically sending into a buffer owned by the caller.
+
+        Unlike :meth:`read_cyclic_can_msg` nothing is allocated or copied, so a buffer created once can be used for
+        every call. The messages are valid until the buffer is used again.
+
+        :param int channel: CAN channel, to be used (:data:`Channel.CHANNEL_CH0` or :data:`Channel.CHANNEL_CH1`).
+        :param buf: Array of CAN messages to be filled, e.g. ``(CanMsg * MAX_CYCLIC_CAN_MSG)()``.
+        :param int or None count: The number of cyclic CAN messages to be received (None for the size of the buffer).
+        :return: The number of CAN messages written to the start of the buffer.
+        :rtype: int
+        """
+        # never let the library write past the end of the buffer
+        c_count = DWORD(len(buf) if count is None else min(count, len(buf)))
+        UcanReadCyclicCanMsg(self._handle, channel, buf, byref(c_count))
+        return c_count.value
 
     def enable_cyclic_can_msg(self, channel, flags):
         """
@@ -1604,7 +2065,7 @@ class USBCanServer:
         """
         count = DWORD(0)
         UcanGetMsgPending(self._handle, channel, flags, byref(count))
-        return count
+        return count.value
 
     def get_can_error_counter(self, channel):
         """
@@ -1619,7 +2080,7 @@ class USBCanServer:
         tx_error_counter = DWORD(0)
         rx_error_counter = DWORD(0)
         UcanGetCanErrorCounter(self._handle, channel, byref(tx_error_counter), byref(rx_error_counter))
-        return tx_error_counter, rx_error_counter
+        return tx_error_counter.value, rx_error_counter.value
 
     def set_tx_timeout(self, channel, timeout):
         """
@@ -1628,7 +2089,9 @@ class USBCanServer:
         :param int channel: CAN channel, to be used (:data:`Channel.CHANNEL_CH0` or :data:`Channel.CHANNEL_CH1`).
         :param float timeout: Transmit timeout in seconds (value 0 disables this feature).
         """
-        UcanSetTxTimeout(self._handle, channel, int(timeout * 1000))
+        # whole seconds need no float conversion
+        timeout_ms = timeout * 1000 if type(timeout) is int else int(timeout * 1000)
+        UcanSetTxTimeout(self._handle, channel, timeout_ms)
 
     def shutdown(self, channel=Channel.CHANNEL_ALL, shutdown_hardware=True):
         """
@@ -1639,17 +2102,28 @@ class USBCanServer:
             :data:`Channel.CHANNEL_ALL`)
         :param bool shutdown_hardware: If true then the hardware interface will be closed too.
         """
+        # the background reader must not read from a channel being shut down
+        if shutdown_hardware or channel == Channel.CHANNEL_ALL or \
+                self._rx_thread_channel in (channel, Channel.CHANNEL_ANY):
+            self.stop_rx_thread()
+
         # shutdown each channel if it's initialized
-        for _channel, is_initialized in self._ch_is_initialized.items():
-            if is_initialized and (_channel == channel or channel == Channel.CHANNEL_ALL or shutdown_hardware):
-                UcanDeinitCanEx(self._handle, _channel)
-                self._ch_is_initialized[_channel] = False
+        if channel == Channel.CHANNEL_ALL or shutdown_hardware:
+            to_close = list(self._initialized_channels)
+        else:
+            to_close = [channel] if channel in self._initialized_channels else []
+        deinit_can, handle = UcanDeinitCanEx, self._handle
+        for _channel in to_close:
+            deinit_can(handle, _channel)
+            self._initialized_channels.discard(_channel)
 
         # shutdown hardware
         if self._hw_is_initialized and shutdown_hardware:
             UcanDeinitHardware(self._handle)
             self._hw_is_initialized = False
             self._handle = Handle(INVALID_HANDLE)
+            self._instances.pop(self._callback_key, None)
+            self._callback_key = None
 
     @staticmethod
     def get_user_dll_version():
@@ -1659,6 +2133,7 @@ class USBCanServer:
         :return: Software version number.
         :rtype: int
         """
+        _load_dll()
         return UcanGetVersionEx(VersionType.VER_TYPE_USER_DLL)
 
     @staticmethod
@@ -1675,6 +2150,7 @@ class USBCanServer:
         :return: False if logfile not created otherwise True.
         :rtype: bool
         """
+        _load_dll()
         return UcanSetDebugMode(level, filename, flags)
 
     @staticmethod
@@ -1686,21 +2162,18 @@ class USBCanServer:
         :return: Status message string.
         :rtype: str
         """
-        status_msgs = {
-            CanStatus.CANERR_TXMSGLOST: "Transmit message lost",
-            CanStatus.CANERR_MEMTEST: "Memory test failed",
-            CanStatus.CANERR_REGTEST: "Register test failed",
-            CanStatus.CANERR_QXMTFULL: "Transmit queue is full",
-            CanStatus.CANERR_QOVERRUN: "Receive queue overrun",
-            CanStatus.CANERR_QRCVEMPTY: "Receive queue is empty",
-            CanStatus.CANERR_BUSOFF: "Bus Off",
-            CanStatus.CANERR_BUSHEAVY: "Error Passive",
-            CanStatus.CANERR_BUSLIGHT: "Warning Limit",
-            CanStatus.CANERR_OVERRUN: "Rx-buffer is full",
-            CanStatus.CANERR_XMTFULL: "Tx-buffer is full",
-        }
-        return "OK" if can_status == CanStatus.CANERR_OK \
-            else ", ".join(msg for status, msg in status_msgs.items() if can_status & status)
+        # CanStatus.CANERR_OK is the only value without any error bit set
+        if not can_status:
+            return "OK"
+        # visit only the bits which are set, from the highest to the lowest one
+        msgs = []
+        while can_status:
+            status = 1 << (can_status.bit_length() - 1)
+            can_status ^= status
+            msg = _CAN_STATUS_MSGS.get(status)
+            if msg is not None:
+                msgs.append(msg)
+        return ", ".join(msgs)
 
     @staticmethod
     def get_baudrate_message(baudrate):
@@ -1713,20 +2186,7 @@ class USBCanServer:
         :return: Baud rate message string.
         :rtype: str
         """
-        baudrate_msgs = {
-            Baudrate.BAUD_AUTO: "auto baudrate",
-            Baudrate.BAUD_10kBit: "10 kBit/sec",
-            Baudrate.BAUD_20kBit: "20 kBit/sec",
-            Baudrate.BAUD_50kBit: "50 kBit/sec",
-            Baudrate.BAUD_100kBit: "100 kBit/sec",
-            Baudrate.BAUD_125kBit: "125 kBit/sec",
-            Baudrate.BAUD_250kBit: "250 kBit/sec",
-            Baudrate.BAUD_500kBit: "500 kBit/sec",
-            Baudrate.BAUD_800kBit: "800 kBit/sec",
-            Baudrate.BAUD_1MBit: "1 MBit/s",
-            Baudrate.BAUD_USE_BTREX: "BTR Ext is used",
-        }
-        return baudrate_msgs.get(baudrate, "BTR is unknown (user specific)")
+        return _BAUDRATE_MSGS.get(baudrate, "BTR is unknown (user specific)")
 
     @staticmethod
     def get_baudrate_ex_message(baudrate_ex):
@@ -1737,32 +2197,10 @@ class USBCanServer:
         :return: Baud rate message string.
         :rtype: str
         """
-        baudrate_ex_msgs = {
-            Baudrate.BAUDEX_AUTO: "auto baudrate",
-            Baudrate.BAUDEX_10kBit: "10 kBit/sec",
-            Baudrate.BAUDEX_SP2_10kBit: "10 kBit/sec",
-            Baudrate.BAUDEX_20kBit: "20 kBit/sec",
-            Baudrate.BAUDEX_SP2_20kBit: "20 kBit/sec",
-            Baudrate.BAUDEX_50kBit: "50 kBit/sec",
-            Baudrate.BAUDEX_SP2_50kBit: "50 kBit/sec",
-            Baudrate.BAUDEX_100kBit: "100 kBit/sec",
-            Baudrate.BAUDEX_SP2_100kBit: "100 kBit/sec",
-            Baudrate.BAUDEX_125kBit: "125 kBit/sec",
-            Baudrate.BAUDEX_SP2_125kBit: "125 kBit/sec",
-            Baudrate.BAUDEX_250kBit: "250 kBit/sec",
-            Baudrate.BAUDEX_SP2_250kBit: "250 kBit/sec",
-            Baudrate.BAUDEX_500kBit: "500 kBit/sec",
-            Baudrate.BAUDEX_SP2_500kBit: "500 kBit/sec",
-            Baudrate.BAUDEX_800kBit: "800 kBit/sec",
-            Baudrate.BAUDEX_SP2_800kBit: "800 kBit/sec",
-            Baudrate.BAUDEX_1MBit: "1 MBit/s",
-            Baudrate.BAUDEX_SP2_1MBit: "1 MBit/s",
-            Baudrate.BAUDEX_USE_BTR01: "BTR0/BTR1 is used",
-        }
-        return baudrate_ex_msgs.get(baudrate_ex, "BTR is unknown (user specific)")
+        return _BAUDRATE_EX_MSGS.get(baudrate_ex, "BTR is unknown (user specific)")
 
-    @classmethod
-    def convert_to_major_ver(cls, version):
+    @staticmethod
+    def convert_to_major_ver(version):
         """
         Converts the a version number into the major version.
 
@@ -1772,8 +2210,8 @@ class USBCanServer:
         """
         return version & 0xFF
 
-    @classmethod
-    def convert_to_minor_ver(cls, version):
+    @staticmethod
+    def convert_to_minor_ver(version):
         """
         Converts the a version number into the minor version.
 
@@ -1783,8 +2221,8 @@ class USBCanServer:
         """
         return (version & 0xFF00) >> 8
 
-    @classmethod
-    def convert_to_release_ver(cls, version):
+    @staticmethod
+    def convert_to_release_ver(version):
         """
         Converts the a version number into the release version.
 
@@ -1805,11 +2243,11 @@ class USBCanServer:
         :return: True if equal or higher, otherwise False.
         :rtype: bool
         """
-        return (cls.convert_to_major_ver(version) > cmp_major) or \
-               (cls.convert_to_major_ver(version) == cmp_major and cls.convert_to_minor_ver(version) >= cmp_minor)
+        major = cls.convert_to_major_ver(version)
+        return (major > cmp_major) or (major == cmp_major and cls.convert_to_minor_ver(version) >= cmp_minor)
 
-    @classmethod
-    def check_is_systec(cls, hw_info_ex):
+    @staticmethod
+    def check_is_systec(hw_info_ex):
         """
         Checks whether the module is a systec USB-CANmodul.
 
@@ -1818,10 +2256,10 @@ class USBCanServer:
         :return: True when the module is a systec USB-CANmodul, otherwise False.
         :rtype: bool
         """
-        return (hw_info_ex.m_dwProductCode & PRODCODE_MASK_PID) >= ProductCode.PRODCODE_PID_MULTIPORT
+        return _is_systec(hw_info_ex.m_dwProductCode)
 
-    @classmethod
-    def check_is_G4(cls, hw_info_ex):
+    @staticmethod
+    def check_is_G4(hw_info_ex):
         """
         Checks whether the module is an USB-CANmodul of fourth generation (G4).
 
@@ -1830,7 +2268,7 @@ class USBCanServer:
         :return: True when the module is an USB-CANmodul G4, otherwise False.
         :rtype: bool
         """
-        return hw_info_ex.m_dwProductCode & PRODCODE_PID_G4
+        return bool(hw_info_ex.m_dwProductCode & PRODCODE_PID_G4)
 
     @classmethod
     def check_is_G3(cls, hw_info_ex):
@@ -1854,8 +2292,7 @@ class USBCanServer:
         :return: True when the module does support cyclic CAN messages, otherwise False.
         :rtype: bool
         """
-        return cls.check_is_systec(hw_info_ex) and \
-               cls.check_version_is_equal_or_higher(hw_info_ex.m_dwFwVersionEx, 3, 6)
+        return cls.check_is_systec(hw_info_ex) and _fw_at_least(hw_info_ex.m_dwFwVersionEx, _FW_CYCLIC_MSG)
 
     @classmethod
     def check_support_two_channel(cls, hw_info_ex):
@@ -1867,10 +2304,10 @@ class USBCanServer:
         :return: True when the module (logical device) does support two CAN channels, otherwise False.
         :rtype: bool
         """
-        return cls.check_is_systec(hw_info_ex) and (hw_info_ex.m_dwProductCode & PRODCODE_PID_TWO_CHA)
+        return cls.check_is_systec(hw_info_ex) and bool(hw_info_ex.m_dwProductCode & PRODCODE_PID_TWO_CHA)
 
-    @classmethod
-    def check_support_term_resistor(cls, hw_info_ex):
+    @staticmethod
+    def check_support_term_resistor(hw_info_ex):
         """
         Checks whether the module supports a termination resistor at the CAN bus.
 
@@ -1879,10 +2316,10 @@ class USBCanServer:
         :return: True when the module does support a termination resistor.
         :rtype: bool
         """
-        return hw_info_ex.m_dwProductCode & PRODCODE_PID_TERM
+        return bool(hw_info_ex.m_dwProductCode & PRODCODE_PID_TERM)
 
-    @classmethod
-    def check_support_user_port(cls, hw_info_ex):
+    @staticmethod
+    def check_support_user_port(hw_info_ex):
         """
         Checks whether the module supports a user I/O port.
 
@@ -1891,12 +2328,10 @@ class USBCanServer:
         :return: True when the module supports a user I/O port, otherwise False.
         :rtype: bool
         """
-        return ((hw_info_ex.m_dwProductCode & PRODCODE_MASK_PID) != ProductCode.PRODCODE_PID_BASIC) \
-               and ((hw_info_ex.m_dwProductCode & PRODCODE_MASK_PID) != ProductCode.PRODCODE_PID_RESERVED1) \
-               and cls.check_version_is_equal_or_higher(hw_info_ex.m_dwFwVersionEx, 2, 16)
+        return _has_user_port(hw_info_ex.m_dwProductCode) and _fw_at_least(hw_info_ex.m_dwFwVersionEx, _FW_USER_PORT)
 
-    @classmethod
-    def check_support_rb_user_port(cls, hw_info_ex):
+    @staticmethod
+    def check_support_rb_user_port(hw_info_ex):
         """
         Checks whether the module supports a user I/O port including read back feature.
 
@@ -1905,10 +2340,10 @@ class USBCanServer:
         :return: True when the module does support a user I/O port including the read back feature, otherwise False.
         :rtype: bool
         """
-        return hw_info_ex.m_dwProductCode & PRODCODE_PID_RBUSER
+        return bool(hw_info_ex.m_dwProductCode & PRODCODE_PID_RBUSER)
 
-    @classmethod
-    def check_support_rb_can_port(cls, hw_info_ex):
+    @staticmethod
+    def check_support_rb_can_port(hw_info_ex):
         """
         Checks whether the module supports a CAN I/O port including read back feature.
 
@@ -1917,7 +2352,7 @@ class USBCanServer:
         :return: True when the module does support a CAN I/O port including the read back feature, otherwise False.
         :rtype: bool
         """
-        return hw_info_ex.m_dwProductCode & PRODCODE_PID_RBCAN
+        return bool(hw_info_ex.m_dwProductCode & PRODCODE_PID_RBCAN)
 
     @classmethod
     def check_support_ucannet(cls, hw_info_ex):
@@ -1929,11 +2364,40 @@ class USBCanServer:
         :return: True when the module does support the usage of the USB-CANnetwork driver, otherwise False.
         :rtype: bool
         """
-        return cls.check_is_systec(hw_info_ex) and \
-               cls.check_version_is_equal_or_higher(hw_info_ex.m_dwFwVersionEx, 3, 8)
+        return cls.check_is_systec(hw_info_ex) and _fw_at_least(hw_info_ex.m_dwFwVersionEx, _FW_UCANNET)
 
     @classmethod
-    def calculate_amr(cls, is_extended, from_id, to_id, rtr_only=False, rtr_too=True):
+    def get_capabilities(cls, hw_info_ex):
+        """
+        Checks all capabilities of the module at once.
+
+        The product code and the firmware version are read once, use this instead of calling several of the
+        ``check_is_*`` and ``check_support_*`` methods for the same module. Like those, it goes through
+        :meth:`check_is_systec` and :meth:`check_is_G4`, so overrides of these in a subclass apply.
+
+        :param HardwareInfoEx hw_info_ex:
+            Extended hardware information structure (see method :meth:`get_hardware_info`).
+        :return: Capabilities of the module.
+        :rtype: Capabilities
+        """
+        product_code, version = hw_info_ex.m_dwProductCode, hw_info_ex.m_dwFwVersionEx
+        is_systec = cls.check_is_systec(hw_info_ex)
+        is_G4 = cls.check_is_G4(hw_info_ex)
+        return Capabilities(
+            is_systec=is_systec,
+            is_G4=is_G4,
+            is_G3=is_systec and not is_G4,
+            support_cyclic_msg=is_systec and _fw_at_least(version, _FW_CYCLIC_MSG),
+            support_two_channel=is_systec and bool(product_code & PRODCODE_PID_TWO_CHA),
+            support_term_resistor=bool(product_code & PRODCODE_PID_TERM),
+            support_user_port=_has_user_port(product_code) and _fw_at_least(version, _FW_USER_PORT),
+            support_rb_user_port=bool(product_code & PRODCODE_PID_RBUSER),
+            support_rb_can_port=bool(product_code & PRODCODE_PID_RBCAN),
+            support_ucannet=is_systec and _fw_at_least(version, _FW_UCANNET),
+        )
+
+    @staticmethod
+    def calculate_amr(is_extended, from_id, to_id, rtr_only=False, rtr_too=True):
         """
         Calculates AMR using CAN-ID range as parameter.
 
@@ -1945,11 +2409,10 @@ class USBCanServer:
         :return: Value for AMR.
         :rtype: int
         """
-        return (((from_id ^ to_id) << 3) | (0x7 if rtr_too and not rtr_only else 0x3)) if is_extended else \
-            (((from_id ^ to_id) << 21) | (0x1FFFFF if rtr_too and not rtr_only else 0xFFFFF))
+        return (_amr_ext if is_extended else _amr_std)(from_id, to_id, rtr_only, rtr_too)
 
-    @classmethod
-    def calculate_acr(cls, is_extended, from_id, to_id, rtr_only=False, rtr_too=True):
+    @staticmethod
+    def calculate_acr(is_extended, from_id, to_id, rtr_only=False, rtr_too=True):
         """
         Calculates ACR using CAN-ID range as parameter.
 
@@ -1961,8 +2424,27 @@ class USBCanServer:
         :return: Value for ACR.
         :rtype: int
         """
-        return (((from_id & to_id) << 3) | (0x04 if rtr_only else 0)) if is_extended else \
-            (((from_id & to_id) << 21) | (0x100000 if rtr_only else 0))
+        return (_acr_ext if is_extended else _acr_std)(from_id, to_id, rtr_only, rtr_too)
+
+    @staticmethod
+    def calculate_amr_acr_bulk(is_extended, from_ids, to_ids, rtr_only=False, rtr_too=True):
+        """
+        Calculates AMR and ACR for many CAN-ID ranges at once.
+
+        :param bool is_extended: If True parameters from_ids and to_ids contains 29-bit CAN-IDs.
+        :param list(int) from_ids: First CAN-ID of each range which should be received.
+        :param list(int) to_ids: Last CAN-ID of each range which should be received.
+        :param bool rtr_only: If True only RTR-Messages should be received, and rtr_too will be ignored.
+        :param bool rtr_too: If True CAN data frames and RTR-Messages should be received.
+        :return: Tuple with the list of AMR values and the list of ACR values, one per range.
+        :rtype: tuple(list(int), list(int))
+
+        .. seealso:: :meth:`calculate_amr` and :meth:`calculate_acr`
+        """
+        amr, acr = (_amr_ext, _acr_ext) if is_extended else (_amr_std, _acr_std)
+        ranges = list(zip(from_ids, to_ids))
+        return [amr(from_id, to_id, rtr_only, rtr_too) for from_id, to_id in ranges], \
+            [acr(from_id, to_id, rtr_only, rtr_too) for from_id, to_id in ranges]
 
     def _connect_control(self, event, param, arg):
         """
@@ -1977,14 +2459,11 @@ class USBCanServer:
         - CbEvent.EVENT_FATALDISCON: USB-CAN-Handle of the disconnected module
         :param arg: Additional parameter defined with :meth:`init_hardware_ex` (not used in this wrapper class).
         """
-        logger.debug("Event: %s, Param: %s" % (event, param))
+        logger.debug("Event: %s, Param: %s", event, param)
 
-        if event == CbEvent.EVENT_FATALDISCON:
-            self.fatal_disconnect_event(param)
-        elif event == CbEvent.EVENT_CONNECT:
-            self.connect_event()
-        elif event == CbEvent.EVENT_DISCONNECT:
-            self.disconnect_event()
+        handler = self._connect_control_handlers.get(event)
+        if handler is not None:
+            handler(param)
 
     def _callback(self, handle, event, channel, arg):
         """
@@ -1996,20 +2475,16 @@ class USBCanServer:
             CAN channel (:data:`Channel.CHANNEL_CH0`, :data:`Channel.CHANNEL_CH1` or :data:`Channel.CHANNEL_ANY`).
         :param arg: Additional parameter defined with :meth:`init_hardware_ex`.
         """
-        logger.debug("Handle: %s, Event: %s, Channel: %s" % (handle, event, channel))
-
-        if event == CbEvent.EVENT_INITHW:
-            self.init_hw_event()
-        elif event == CbEvent.EVENT_init_can:
-            self.init_can_event(channel)
-        elif event == CbEvent.EVENT_RECEIVE:
-            self.can_msg_received_event(channel)
-        elif event == CbEvent.EVENT_STATUS:
-            self.status_event(channel)
-        elif event == CbEvent.EVENT_DEINIT_CAN:
-            self.deinit_can_event(channel)
-        elif event == CbEvent.EVENT_DEINITHW:
-            self.deinit_hw_event()
+        logger.debug("Handle: %s, Event: %s, Channel: %s", handle, event, channel)
+
+        if event == _EVENT_RECEIVE:
+            # wakes up readers waiting for CAN messages before the application is notified
+            self._rx_event.set()
+            self._on_receive(channel)
+            return
+        handler = self._callback_handlers.get(event)
+        if handler is not None:
+            handler(channel)
 
     def init_hw_event(self):
         """
@@ -2101,3 +2576,4 @@ class USBCanServer:
 
 
 USBCanServer._enum_callback_ref = EnumCallback(USBCanServer._enum_callback)
+USBCanServer._callback_ref = CallbackFktEx(USBCanServer._dispatch_callback)